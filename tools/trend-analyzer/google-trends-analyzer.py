@@ -4,97 +4,756 @@ Google Trends Analyzer - Hermetic Agent: Janus
 Validates market demand by analyzing Google search trends
 """
 
+from __future__ import annotations
+
+import argparse
+import bisect
+import contextlib
+import functools
+import heapq
+import importlib
+import importlib.util
+import itertools
 import json
+import math
+import operator
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional
 from pathlib import Path
-from pytrends.request import TrendReq
-import pandas as pd
 import time
 
+
+class LazyModule:
+    """
+    Stand-in for a heavy module that imports it on first attribute access.
+
+    The real module then replaces the stand-in under its global name, so
+    later accesses cost nothing extra. Runs that only format reports from
+    exported JSON never import pandas, numpy, pytrends or pyarrow, nor the
+    asyncio and http.server machinery of the async front end and stub.
+    """
+
+    def __init__(self, name: str, alias: str, *submodules: str):
+        self._name = name
+        self._alias = alias
+        self._submodules = submodules
+
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self._name)
+        for submodule in self._submodules:
+            importlib.import_module(f"{self._name}.{submodule}")
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+asyncio = LazyModule('asyncio', 'asyncio')
+http = LazyModule('http', 'http', 'server')
+np = LazyModule('numpy', 'np')
+pd = LazyModule('pandas', 'pd')
+pytrends_request = LazyModule('pytrends.request', 'pytrends_request')
+# Optional: only needed for the columnar trend store
+pyarrow = LazyModule('pyarrow', 'pyarrow', 'compute', 'ipc') if importlib.util.find_spec('pyarrow') else None
+
+
+class ResponseCache:
+    """
+    On-disk SQLite cache of Trends responses.
+
+    Entries are keyed by (endpoint, keywords, timeframe, geo, hl, tz) and
+    hold the pickled pytrends result: the language and timezone offset
+    change the labels and date bucketing Trends returns. Entries older
+    than `ttl` seconds are ignored, and once the cache grows past
+    `max_bytes` the least recently used entries are evicted.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            accessed REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+    """
+
+    def __init__(self, path: str = "output/trends_cache.db", ttl: float = 24 * 3600,
+                 max_bytes: int = 256 * 2**20):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(endpoint: str, keywords: List[str], timeframe: str, geo: str, hl: str, tz: int) -> str:
+        return json.dumps([endpoint, list(keywords), timeframe, geo, hl, tz], ensure_ascii=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response, or None if it is missing or expired"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND created > ?", (key, now - self.ttl)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._conn:
+                self._conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])
+
+    def __contains__(self, key: str) -> bool:
+        """Whether an unexpired response is cached, without loading or touching it"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM responses WHERE key = ? AND created > ?", (key, time.time() - self.ttl)
+            ).fetchone() is not None
+
+    def put(self, key: str, value: Any):
+        """Store a response, evicting expired and least recently used entries as needed"""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now)
+            )
+            self._conn.execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl,))
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                evict = []
+                for entry, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+                    if excess <= 0:
+                        break
+                    evict.append((entry,))
+                    excess -= size
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", evict)
+
+    def close(self):
+        self._conn.close()
+
+
+class TrendsProfiler:
+    """
+    Opt-in timing of where an analyzer's time goes.
+
+    span() times a block as a named phase on the calling thread, and
+    count() bumps a counter such as cache hits or retries. summary() totals
+    every phase. export_trace() writes all spans and counters as Chrome
+    trace-event JSON, viewable in chrome://tracing or ui.perfetto.dev, with
+    nested phases stacked per thread. An analyzer without a profiler skips
+    all of this behind a single None check per hook.
+    """
+
+    def __init__(self):
+        self.spans = []
+        self.counters: Dict[str, int] = {}
+        self._counter_events = []
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = 'phase', **args):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            # list.append is atomic, spans from worker threads need no lock
+            self.spans.append((name, category, start, time.perf_counter_ns() - start, threading.get_ident(), args))
+
+    def count(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+            self._counter_events.append((name, time.perf_counter_ns(), self.counters[name]))
+
+    def summary(self) -> Dict[str, Dict]:
+        """Calls, total, mean and max milliseconds of every phase, longest total first"""
+        phases: Dict[str, List[int]] = {}
+        for name, _, _, duration, _, _ in self.spans:
+            phases.setdefault(name, []).append(duration)
+        return {
+            name: {'calls': len(durations), 'total_ms': round(sum(durations) / 1e6, 3),
+                   'mean_ms': round(sum(durations) / len(durations) / 1e6, 3), 'max_ms': round(max(durations) / 1e6, 3)}
+            for name, durations in sorted(phases.items(), key=lambda item: -sum(item[1]))
+        }
+
+    def report(self) -> str:
+        """summary() and the counters as a text table"""
+        lines = [f"{'Phase':<28} {'Calls':>6} {'Total ms':>10} {'Mean ms':>9} {'Max ms':>9}"]
+        for name, phase in self.summary().items():
+            lines.append(f"{name:<28} {phase['calls']:>6} {phase['total_ms']:>10.1f} "
+                         f"{phase['mean_ms']:>9.2f} {phase['max_ms']:>9.2f}")
+        lines += [f"{name:<28} {value:>6}" for name, value in sorted(self.counters.items())]
+        return '\n'.join(lines)
+
+    def export_trace(self, path: str) -> str:
+        """Write the spans and counters as Chrome trace-event JSON"""
+        pid = os.getpid()
+        events = [{'name': name, 'cat': category, 'ph': 'X', 'ts': (start - self._origin) / 1000,
+                   'dur': duration / 1000, 'pid': pid, 'tid': tid, 'args': args}
+                  for name, category, start, duration, tid, args in self.spans]
+        events += [{'name': name, 'ph': 'C', 'ts': (at - self._origin) / 1000, 'pid': pid, 'args': {name: value}}
+                   for name, at, value in self._counter_events]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+        return path
+
+
+# Stands in for a span when profiling is off
+NO_SPAN = contextlib.nullcontext()
+
+
+def profiled(method):
+    """Time every call of an analyzer method as a phase of its own name"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.profiler is None:
+            return method(self, *args, **kwargs)
+        with self.profiler.span(method.__name__):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class AdaptiveRateLimiter:
+    """
+    Request pacing that only slows down when Google pushes back.
+
+    Requests go out back to back until a 429 arrives. Each 429 doubles the
+    gap enforced between requests (starting at `initial_backoff`, capped at
+    `max_interval`), and every success halves it again until it is gone.
+    """
+
+    def __init__(self, initial_backoff: float = 1.0, max_interval: float = 60.0, max_retries: int = 5):
+        self.initial_backoff = initial_backoff
+        self.max_interval = max_interval
+        self.max_retries = max_retries
+        self.interval = 0.0
+        self.retries = 0
+        self.profiler: Optional[TrendsProfiler] = None
+        self._next_request = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the current interval since the previous request has passed"""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next_request - now)
+            self._next_request = max(now, self._next_request) + self.interval
+        if delay:
+            with self.profiler.span('rate_limit_wait', 'sleep') if self.profiler is not None else NO_SPAN:
+                time.sleep(delay)
+
+    def success(self):
+        with self._lock:
+            self.interval = self.interval / 2 if self.interval > self.initial_backoff / 8 else 0.0
+
+    def throttled(self):
+        with self._lock:
+            self.retries += 1
+            if self.profiler is not None:
+                self.profiler.count('retries')
+            self.interval = min(self.max_interval, max(self.initial_backoff, self.interval * 2))
+            self._next_request = time.monotonic() + self.interval
+
+    def call(self, request, *args, **kwargs):
+        """Run `request`, backing off and retrying while it is rate limited"""
+        for attempt in range(self.max_retries + 1):
+            self.wait()
+            try:
+                result = request(*args, **kwargs)
+            except pytrends_request.exceptions.TooManyRequestsError:
+                if attempt == self.max_retries:
+                    raise
+                self.throttled()
+                continue
+            self.success()
+            return result
+
+
+class TrendStore:
+    """
+    Columnar history of interest-over-time pulls, as Arrow IPC files.
+
+    Each pull is appended as a small segment file of (keyword, geo, date,
+    interest, fetched_at) rows. compact() merges everything into one base
+    file sorted by (geo, keyword, date). Where pulls overlap, the latest
+    fetch of a week wins. The base file's schema metadata maps each
+    (geo, keyword) to its row range, so reads memory-map the base and slice
+    the requested keywords and dates out of it without copying.
+
+    Trends scales every pull to its own peak, so values are only directly
+    comparable within one pull. The latest pull supersedes older weeks
+    rather than being blended with them.
+
+    Analysis results exported while a store is configured are appended to
+    one analyses.jsonl next to the series, instead of a JSON file per run.
+    """
+
+    @functools.cached_property
+    def schema(self) -> 'pyarrow.Schema':
+        return pyarrow.schema([
+            ('keyword', pyarrow.string()),
+            ('geo', pyarrow.string()),
+            ('date', pyarrow.timestamp('s')),
+            ('interest', pyarrow.int16()),
+            ('fetched_at', pyarrow.timestamp('s')),
+        ])
+
+    BASE = 'trends.arrow'
+    ANALYSES = 'analyses.jsonl'
+    # Merge appended segments into the base file once this many pile up
+    MAX_SEGMENTS = 32
+
+    def __init__(self, path: str = "output/trends_store"):
+        if pyarrow is None:
+            raise RuntimeError("The trend store requires: pip install pyarrow")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sequence = 0
+
+    def _segments(self) -> List[Path]:
+        return sorted(self.path.glob('segment-*.arrow'))
+
+    def append(self, frame: pd.DataFrame, geo: str = '', fetched_at: Optional[datetime] = None) -> int:
+        """
+        Add an interest_over_time frame (dates x keywords) to the store, returning the rows stored
+
+        The store holds weekly series: daily and hourly pulls (windows
+        shorter than about nine months) are skipped with a warning.
+        """
+        frame = frame.drop(columns='isPartial', errors='ignore')
+        if frame.empty:
+            return 0
+        if len(frame) > 1 and frame.index[1] - frame.index[0] < pd.Timedelta(days=7):
+            print(f"⚠️  Trend store keeps weekly series only: skipped {frame.size} rows of "
+                  f"{', '.join(map(str, frame.columns))} at {frame.index[1] - frame.index[0]} resolution")
+            return 0
+        dates, keywords = frame.shape
+        values = frame.to_numpy()
+        table = pyarrow.table({
+            'keyword': np.repeat(frame.columns.to_numpy(dtype=object), dates),
+            'geo': [geo] * (dates * keywords),
+            'date': np.tile(frame.index.to_numpy(dtype='datetime64[s]'), keywords),
+            'interest': values.T.ravel().astype(np.int16),
+            'fetched_at': np.full(dates * keywords, np.datetime64(fetched_at or datetime.now(), 's')),
+        }, schema=self.schema)
+
+        with self._lock:
+            self._sequence += 1
+            segment = self.path / f"segment-{time.time_ns()}-{self._sequence:04d}.arrow"
+            with pyarrow.ipc.new_file(segment, self.schema) as writer:
+                writer.write_table(table)
+            if len(self._segments()) > self.MAX_SEGMENTS:
+                self._compact()
+        return table.num_rows
+
+    def append_analysis(self, data: Dict) -> Path:
+        """Append one exported analysis as a JSON line of analyses.jsonl"""
+        path = self.path / self.ANALYSES
+        line = json.dumps(data, ensure_ascii=False) + '\n'
+        with self._lock, open(path, 'a', encoding='utf-8') as f:
+            f.write(line)
+        return path
+
+    def analyses(self) -> Iterator[Dict]:
+        """Every exported analysis, oldest first"""
+        path = self.path / self.ANALYSES
+        if path.exists():
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+
+    @staticmethod
+    def _latest(table: 'pyarrow.Table') -> 'pyarrow.Table':
+        """Sort by (geo, keyword, date) and keep the most recent fetch of every week"""
+        order = pyarrow.compute.sort_indices(table, sort_keys=[
+            ('geo', 'ascending'), ('keyword', 'ascending'), ('date', 'ascending'), ('fetched_at', 'descending')
+        ])
+        table = table.take(order)
+        if table.num_rows < 2:
+            return table
+        return table.filter(TrendStore._run_starts(table, ('geo', 'keyword', 'date')))
+
+    @staticmethod
+    def _run_starts(table: 'pyarrow.Table', columns) -> np.ndarray:
+        """Mask of rows that start a new run of equal `columns` values in a sorted table"""
+        changed = np.zeros(table.num_rows - 1, dtype=bool)
+        for name in columns:
+            column = table[name]
+            changed |= pyarrow.compute.not_equal(column[1:], column[:-1]).to_numpy(zero_copy_only=False)
+        return np.concatenate(([True], changed))
+
+    def compact(self):
+        """Merge every segment into the sorted, deduplicated base file"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        segments = self._segments()
+        if not segments:
+            return
+        base = self.path / self.BASE
+        tables = [self._open(path)[0] for path in ([base] if base.exists() else []) + segments]
+        table = self._latest(pyarrow.concat_tables(tables)).combine_chunks()
+
+        starts = np.flatnonzero(self._run_starts(table, ('geo', 'keyword'))) if table.num_rows else np.array([], int)
+        lengths = np.diff(np.append(starts, table.num_rows))
+        index = [[geo, keyword, int(start), int(length)] for geo, keyword, start, length in zip(
+            table['geo'].take(starts).to_pylist(), table['keyword'].take(starts).to_pylist(), starts, lengths)]
+
+        schema = self.schema.with_metadata({'index': json.dumps(index, ensure_ascii=False)})
+        staging = self.path / f"{self.BASE}.tmp"
+        with pyarrow.ipc.new_file(staging, schema) as writer:
+            writer.write_table(table.replace_schema_metadata(schema.metadata))
+        del tables
+        os.replace(staging, base)
+        for segment in segments:
+            segment.unlink()
+
+    @staticmethod
+    def _open(path: Path):
+        """Memory-map an IPC file: returns the (zero-copy) table and its schema metadata"""
+        with pyarrow.memory_map(str(path)) as source:
+            reader = pyarrow.ipc.open_file(source)
+            return reader.read_all(), reader.schema.metadata or {}
+
+    def read(self, keywords: Optional[List[str]] = None, start=None, end=None, geo: str = '') -> 'pyarrow.Table':
+        """
+        Stored weeks of `keywords` (all when None) between `start` and `end`, inclusive
+
+        Rows come back sorted by keyword and date. Compacted data is sliced
+        straight out of the memory-mapped base file; only rows still in
+        segments are filtered and deduplicated.
+        """
+        low = np.datetime64(pd.Timestamp(start), 's') if start is not None else None
+        high = np.datetime64(pd.Timestamp(end), 's') if end is not None else None
+        wanted = set(keywords) if keywords is not None else None
+        parts = []
+
+        base = self.path / self.BASE
+        if base.exists():
+            table, metadata = self._open(base)
+            for entry_geo, keyword, offset, length in json.loads(metadata.get(b'index', b'[]')):
+                if entry_geo != geo or (wanted is not None and keyword not in wanted):
+                    continue
+                rows = table.slice(offset, length)
+                dates = rows['date'].to_numpy()
+                first = int(np.searchsorted(dates, low, 'left')) if low is not None else 0
+                last = int(np.searchsorted(dates, high, 'right')) if high is not None else length
+                parts.append(rows.slice(first, last - first))
+
+        segments = self._segments()
+        for segment in segments:
+            table, _ = self._open(segment)
+            mask = pyarrow.compute.equal(table['geo'], geo)
+            if wanted is not None:
+                mask = pyarrow.compute.and_(mask, pyarrow.compute.is_in(table['keyword'],
+                                                                       value_set=pyarrow.array(sorted(wanted))))
+            if low is not None:
+                mask = pyarrow.compute.and_(mask, pyarrow.compute.greater_equal(table['date'], pyarrow.scalar(low)))
+            if high is not None:
+                mask = pyarrow.compute.and_(mask, pyarrow.compute.less_equal(table['date'], pyarrow.scalar(high)))
+            parts.append(table.filter(mask))
+
+        if not parts:
+            return self.schema.empty_table()
+        table = pyarrow.concat_tables(parts)
+        return self._latest(table) if segments else table
+
+    def frame(self, keywords: Optional[List[str]] = None, start=None, end=None, geo: str = '') -> pd.DataFrame:
+        """Stored history as a wide dates x keywords frame, ready for trend_metrics"""
+        table = self.read(keywords, start, end, geo)
+        if table.num_rows == 0:
+            return pd.DataFrame()
+        return table.select(['date', 'keyword', 'interest']).to_pandas().pivot(
+            index='date', columns='keyword', values='interest')
+
+
+class ScoreLadder:
+    """
+    An if/elif scoring ladder compiled into a lookup table.
+
+    `rungs` are (operator, threshold, points) tried in order: the first that
+    holds wins, and `default` applies when none does. The thresholds cut the
+    number line into the thresholds themselves and the open intervals around
+    them. The ladder is climbed once per region up front. Scoring a value is
+    then two binary searches, and scoring an array is two np.searchsorted
+    calls, with results identical to climbing the ladder.
+    """
+
+    OPERATORS = {'>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt, '==': operator.eq}
+
+    def __init__(self, rungs: List[tuple], default: Any = 0):
+        self.rungs = [(self.OPERATORS[op], threshold, points) for op, threshold, points in rungs]
+        self.default = default
+        self.edges = sorted({threshold for _, threshold, _ in rungs})
+        # Region 2i is the interval below edges[i], region 2i + 1 is edges[i] itself
+        probes = []
+        for i, edge in enumerate(self.edges):
+            probes += [(self.edges[i - 1] + edge) / 2 if i else edge - 1, edge]
+        probes.append(self.edges[-1] + 1)
+        self.table = [self._climb(value) for value in probes]
+        self.nan_points = self._climb(math.nan)
+
+    @functools.cached_property
+    def _edges(self) -> np.ndarray:
+        return np.array(self.edges, dtype=float)
+
+    @functools.cached_property
+    def _table(self) -> np.ndarray:
+        # NaN compares false everywhere: it gets a region of its own past the end
+        return np.array(self.table + [self.nan_points])
+
+    def _climb(self, value) -> Any:
+        for compare, threshold, points in self.rungs:
+            if compare(value, threshold):
+                return points
+        return self.default
+
+    def __call__(self, value) -> Any:
+        """Points for one value"""
+        if value != value:
+            return self.nan_points
+        return self.table[bisect.bisect_left(self.edges, value) + bisect.bisect_right(self.edges, value)]
+
+    def regions(self, values) -> np.ndarray:
+        """Index into the compiled table of every value in an array"""
+        values = np.asarray(values, dtype=float)
+        regions = (np.searchsorted(self._edges, values, side='left') +
+                   np.searchsorted(self._edges, values, side='right'))
+        regions[np.isnan(values)] = len(self.table)
+        return regions
+
+    def score(self, values) -> np.ndarray:
+        """Points for every value in an array"""
+        return self._table[self.regions(values)]
+
+    def categorical(self, values) -> pd.Categorical:
+        """score() for label ladders, as a Categorical that stores one small code per value"""
+        labels = list(dict.fromkeys(self._table.tolist()))
+        codes = np.array([labels.index(label) for label in self._table.tolist()], dtype=np.int8)
+        return pd.Categorical.from_codes(codes[self.regions(values)], labels)
+
+
+class TrendsSession:
+    """A pytrends client plus the payload its widget tokens currently belong to"""
+
+    def __init__(self, pytrends: 'pytrends_request.TrendReq'):
+        self.pytrends = pytrends
+        self.payload = None
+        self.lock = threading.Lock()
+
+
 class GoogleTrendsAnalyzer:
     """Analyzes Google Trends data for MicroSaaS opportunity validation"""
 
-    def __init__(self, language='en-US', timezone=360):
-        """Initialize Google Trends connection"""
-        self.pytrends = TrendReq(hl=language, tz=timezone)
+    # Opportunity scoring (100 points)
+    INTEREST_POINTS = ScoreLadder([('>=', 75, 40), ('>=', 50, 30), ('>=', 25, 20), ('>=', 10, 10)])
+    TREND_DIRECTION_POINTS = {'rising': 30, 'stable': 20, 'declining': 5}
+    GROWTH_POINTS = ScoreLadder([('>', 50, 20), ('>', 20, 15), ('>', 0, 10), ('>', -20, 5)])
+    RISING_QUERY_POINTS = ScoreLadder([('>=', 10, 10), ('>=', 5, 7), ('>=', 3, 5)])
+    OPPORTUNITY_STATUS = ScoreLadder([('>=', 70, 'strong'), ('>=', 50, 'moderate'), ('>=', 30, 'weak')], 'poor')
+    RECOMMENDATIONS = {
+        'strong': '✅ Strong opportunity - High demand and positive trends',
+        'moderate': '⚠️  Moderate opportunity - Decent demand but watch trends',
+        'weak': '❌ Weak opportunity - Low demand or declining trends',
+        'poor': '❌ Poor opportunity - Insufficient demand',
+    }
+
+    def __init__(self, language='en-US', timezone=360, cache_path: Optional[str] = "output/trends_cache.db",
+                 cache_ttl: float = 24 * 3600, store_path: Optional[str] = None):
+        """
+        Initialize Google Trends connection
+
+        Responses are cached in `cache_path` for `cache_ttl` seconds, so
+        repeated validations within a day never touch the network. Pass
+        cache_path=None to always fetch. Given a `store_path` (and
+        pyarrow), every interest-over-time pull is also kept in a TrendStore
+        there for bulk analysis. The pytrends session (which costs a
+        cookie request) is only created once a request needs it.
+        """
+        self.language = language
+        self.timezone = timezone
+        self.cache = ResponseCache(cache_path, ttl=cache_ttl) if cache_path else None
+        self.limiter = AdaptiveRateLimiter()
+        self.store = TrendStore(store_path) if store_path and pyarrow is not None else None
+        self.requests = 0
+        self.profiler: Optional[TrendsProfiler] = None
+        self._lock = threading.Lock()
+        # pytrends keeps the current payload on the session: one per thread
+        self._local = threading.local()
         self.results = {}
 
+    @property
+    def pytrends(self) -> 'pytrends_request.TrendReq':
+        """The calling thread's pytrends client, created on first use"""
+        return self._session().pytrends
+
+    def new_session(self) -> 'TrendsSession':
+        return TrendsSession(pytrends_request.TrendReq(hl=self.language, tz=self.timezone))
+
+    def _session(self) -> 'TrendsSession':
+        """Return the calling thread's pytrends session"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self.new_session()
+        return session
+
+    def _cache_key(self, endpoint: str, keywords: List[str], timeframe: str, geo: str) -> str:
+        return ResponseCache.key(endpoint, keywords, timeframe, geo, self.language, self.timezone)
+
+    def _fetch(self, endpoint: str, keywords: List[str], timeframe: str, geo: str,
+               session: Optional['TrendsSession'] = None, **kwargs):
+        """
+        Return a pytrends endpoint result, from the cache when possible
+
+        The payload (itself a token request) is only built on a cache miss,
+        and every network call goes through the adaptive limiter. Calls for
+        the same payload may share a session concurrently: the first one
+        builds the payload and the others wait for it.
+        """
+        key = self._cache_key(endpoint, keywords, timeframe, geo)
+        if self.cache is not None:
+            with self._span('cache_read', 'cache'):
+                cached = self.cache.get(key)
+            if self.profiler is not None:
+                self.profiler.count('cache_hits' if cached is not None else 'cache_misses')
+            if cached is not None:
+                return cached
+
+        session = session or self._session()
+        payload = (tuple(keywords), timeframe, geo)
+        with session.lock:
+            if session.payload != payload:
+                session.payload = None
+                self._count_request()
+                with self._span('build_payload', 'network', keywords=list(keywords)):
+                    self.limiter.call(session.pytrends.build_payload, list(keywords), timeframe=timeframe, geo=geo)
+                session.payload = payload
+
+        self._count_request()
+        with self._span(endpoint, 'network', keywords=list(keywords)):
+            result = self.limiter.call(getattr(session.pytrends, endpoint), **kwargs)
+        if self.cache is not None:
+            with self._span('cache_write', 'cache'):
+                self.cache.put(key, result)
+        if endpoint == 'interest_over_time' and self.store is not None:
+            with self._span('store_append', 'store'):
+                self.store.append(result, geo=geo)
+        return result
+
+    def _span(self, name: str, category: str = 'phase', **args):
+        """Time a block when profiling is enabled"""
+        return self.profiler.span(name, category, **args) if self.profiler is not None else NO_SPAN
+
+    def enable_profiling(self) -> 'TrendsProfiler':
+        """Start recording phase timings and counters (see TrendsProfiler)"""
+        self.profiler = self.limiter.profiler = TrendsProfiler()
+        return self.profiler
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    @staticmethod
+    def _series_metrics(data_series: pd.Series) -> Dict:
+        """Interest and trend metrics of one keyword's interest-over-time series"""
+        current_interest = int(data_series.iloc[-1])
+        avg_interest = int(data_series.mean())
+        max_interest = int(data_series.max())
+        min_interest = int(data_series.min())
+
+        # Trend direction (last 3 months vs previous 3 months)
+        if len(data_series) >= 24:  # weekly data for 6 months
+            recent = data_series[-12:].mean()
+            previous = data_series[-24:-12].mean()
+            trend_direction = 'rising' if recent > previous else 'declining' if recent < previous else 'stable'
+            trend_change = ((recent - previous) / previous * 100) if previous > 0 else 0
+        else:
+            trend_direction = 'insufficient_data'
+            trend_change = 0
+
+        return {
+            'current_interest': current_interest,
+            'average_interest': avg_interest,
+            'max_interest': max_interest,
+            'min_interest': min_interest,
+            'trend_direction': trend_direction,
+            'trend_change_percent': round(trend_change, 2),
+        }
+
+    @staticmethod
+    def trend_metrics(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        _series_metrics for every keyword column of a wide interest frame at once
+
+        Returns one row per keyword. The reductions go through the same pandas
+        code path as the per-series ones, so the values are identical; only
+        the per-keyword Python overhead is gone.
+        """
+        frame = frame.drop(columns='isPartial', errors='ignore')
+        metrics = pd.DataFrame({
+            # int() truncates toward zero, as astype does
+            'current_interest': frame.iloc[-1].to_numpy(dtype=np.float64).astype(np.int64),
+            'average_interest': frame.mean().to_numpy().astype(np.int64),
+            'max_interest': frame.max().to_numpy(dtype=np.float64).astype(np.int64),
+            'min_interest': frame.min().to_numpy(dtype=np.float64).astype(np.int64),
+        }, index=frame.columns)
+
+        # Trend direction (last 3 months vs previous 3 months)
+        if len(frame) >= 24:  # weekly data for 6 months
+            recent = frame.iloc[-12:].mean().to_numpy()
+            previous = frame.iloc[-24:-12].mean().to_numpy()
+            metrics['trend_direction'] = np.where(recent > previous, 'rising',
+                                                  np.where(recent < previous, 'declining', 'stable'))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change = np.where(previous > 0, (recent - previous) / previous * 100, 0.0)
+            metrics['trend_change_percent'] = np.round(change, 2)
+        else:
+            metrics['trend_direction'] = 'insufficient_data'
+            metrics['trend_change_percent'] = 0.0
+
+        return metrics
+
+    @profiled
     def analyze_keyword(self, keyword: str, timeframe='today 12-m', geo='') -> Dict:
         """Analyze a single keyword's trend data"""
         print(f"Analyzing: {keyword}")
 
         try:
-            # Build payload
-            self.pytrends.build_payload([keyword], timeframe=timeframe, geo=geo)
-
             # Get interest over time
-            interest_over_time = self.pytrends.interest_over_time()
+            interest_over_time = self._fetch('interest_over_time', [keyword], timeframe, geo)
 
             if interest_over_time.empty:
-                return {
-                    'keyword': keyword,
-                    'status': 'no_data',
-                    'message': 'Insufficient search volume'
-                }
-
-            # Calculate metrics
-            data_series = interest_over_time[keyword]
-            current_interest = int(data_series.iloc[-1])
-            avg_interest = int(data_series.mean())
-            max_interest = int(data_series.max())
-            min_interest = int(data_series.min())
-
-            # Trend direction (last 3 months vs previous 3 months)
-            if len(data_series) >= 24:  # weekly data for 6 months
-                recent = data_series[-12:].mean()
-                previous = data_series[-24:-12].mean()
-                trend_direction = 'rising' if recent > previous else 'declining' if recent < previous else 'stable'
-                trend_change = ((recent - previous) / previous * 100) if previous > 0 else 0
-            else:
-                trend_direction = 'insufficient_data'
-                trend_change = 0
+                return self._no_data(keyword)
 
             # Get related queries
-            time.sleep(1)  # Rate limiting
-            related_queries = self.pytrends.related_queries()
-
-            top_queries = []
-            rising_queries = []
-
-            if keyword in related_queries and related_queries[keyword]['top'] is not None:
-                top_queries = related_queries[keyword]['top'].head(10).to_dict('records')
-
-            if keyword in related_queries and related_queries[keyword]['rising'] is not None:
-                rising_queries = related_queries[keyword]['rising'].head(10).to_dict('records')
+            related_queries = self._fetch('related_queries', [keyword], timeframe, geo)
 
             # Get regional interest
-            time.sleep(1)
             try:
-                regional_interest = self.pytrends.interest_by_region()
-                top_regions = regional_interest.nlargest(5, keyword).to_dict()[keyword] if not regional_interest.empty else {}
-            except:
-                top_regions = {}
+                regional_interest = self._fetch('interest_by_region', [keyword], timeframe, geo)
+            except Exception:
+                regional_interest = None
 
-            return {
-                'keyword': keyword,
-                'status': 'success',
-                'metrics': {
-                    'current_interest': current_interest,
-                    'average_interest': avg_interest,
-                    'max_interest': max_interest,
-                    'min_interest': min_interest,
-                    'trend_direction': trend_direction,
-                    'trend_change_percent': round(trend_change, 2),
-                },
-                'related_queries': {
-                    'top': top_queries,
-                    'rising': rising_queries
-                },
-                'regional_interest': top_regions,
-                'timeframe': timeframe,
-                'analyzed_at': datetime.now().isoformat()
-            }
+            return self._analysis(keyword, timeframe, interest_over_time, related_queries, regional_interest)
 
         except Exception as e:
             return {
@@ -103,6 +762,49 @@ class GoogleTrendsAnalyzer:
                 'error': str(e)
             }
 
+    @staticmethod
+    def _no_data(keyword: str) -> Dict:
+        return {
+            'keyword': keyword,
+            'status': 'no_data',
+            'message': 'Insufficient search volume'
+        }
+
+    def _analysis(self, keyword: str, timeframe: str, interest_over_time: pd.DataFrame,
+                  related_queries: Optional[Dict], regional_interest: Optional[pd.DataFrame]) -> Dict:
+        """Assemble analyze_keyword's result from the three endpoint responses"""
+        # Calculate metrics
+        with self._span('metrics', 'compute'):
+            metrics = self._series_metrics(interest_over_time[keyword])
+
+        top_queries = []
+        rising_queries = []
+
+        if related_queries and keyword in related_queries and related_queries[keyword]['top'] is not None:
+            top_queries = related_queries[keyword]['top'].head(10).to_dict('records')
+
+        if related_queries and keyword in related_queries and related_queries[keyword]['rising'] is not None:
+            rising_queries = related_queries[keyword]['rising'].head(10).to_dict('records')
+
+        try:
+            top_regions = regional_interest.nlargest(5, keyword).to_dict()[keyword] if not regional_interest.empty else {}
+        except Exception:
+            top_regions = {}
+
+        return {
+            'keyword': keyword,
+            'status': 'success',
+            'metrics': metrics,
+            'related_queries': {
+                'top': top_queries,
+                'rising': rising_queries
+            },
+            'regional_interest': top_regions,
+            'timeframe': timeframe,
+            'analyzed_at': datetime.now().isoformat()
+        }
+
+    @profiled
     def compare_keywords(self, keywords: List[str], timeframe='today 12-m', geo='') -> Dict:
         """Compare multiple keywords"""
         print(f"Comparing keywords: {', '.join(keywords)}")
@@ -112,23 +814,23 @@ class GoogleTrendsAnalyzer:
             keywords = keywords[:5]
 
         try:
-            self.pytrends.build_payload(keywords, timeframe=timeframe, geo=geo)
-
             # Get comparative interest
-            interest_over_time = self.pytrends.interest_over_time()
+            interest_over_time = self._fetch('interest_over_time', keywords, timeframe, geo)
 
             if interest_over_time.empty:
                 return {'status': 'no_data', 'message': 'Insufficient data for comparison'}
 
             # Calculate relative popularity
-            comparison = {}
-            for keyword in keywords:
-                if keyword in interest_over_time.columns:
-                    comparison[keyword] = {
-                        'average_interest': int(interest_over_time[keyword].mean()),
-                        'current_interest': int(interest_over_time[keyword].iloc[-1]),
-                        'max_interest': int(interest_over_time[keyword].max())
-                    }
+            with self._span('metrics', 'compute'):
+                metrics = self.trend_metrics(interest_over_time[[k for k in keywords if k in interest_over_time.columns]])
+            comparison = {
+                keyword: {
+                    'average_interest': int(row['average_interest']),
+                    'current_interest': int(row['current_interest']),
+                    'max_interest': int(row['max_interest'])
+                }
+                for keyword, row in metrics.iterrows()
+            }
 
             # Rank by average interest
             ranked = sorted(comparison.items(), key=lambda x: x[1]['average_interest'], reverse=True)
@@ -145,6 +847,239 @@ class GoogleTrendsAnalyzer:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
 
+    @profiled
+    def batch_compare(self, keywords: List[str], anchor: Optional[str] = None, timeframe='today 12-m',
+                      geo='', workers: int = 4) -> Dict:
+        """
+        Rank any number of keywords on one common 0-100 scale
+
+        Trends normalizes every payload to its own peak, so payloads are not
+        comparable. Keywords are split into groups of four plus a shared
+        anchor term, which takes about N/4 payloads. Each group is rescaled
+        by how much interest the anchor received in it relative to the first
+        group, and the merged table is normalized so its peak is 100. Groups
+        are fetched concurrently under the shared rate limiter.
+
+        Trends reports whole numbers, so a low-interest anchor magnifies
+        rounding in every rescaled group. Unless given, the anchor is the
+        keyword with the highest peak in the first five, whose payload then
+        serves as the first group.
+        """
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            raise ValueError("batch_compare needs at least one keyword")
+
+        def fetch(terms: List[str]) -> Optional[pd.DataFrame]:
+            try:
+                return self._fetch('interest_over_time', terms, timeframe, geo)
+            except Exception as e:
+                print(f"⚠️  Group {', '.join(terms)} failed: {e}")
+                return None
+
+        first = None
+        if anchor is None:
+            first = fetch(keywords[:5])
+            if first is not None and not first.empty:
+                anchor = first[keywords[:5]].max().idxmax()
+            else:
+                anchor, first = keywords[0], None
+        members = [keyword for keyword in keywords if keyword != anchor]
+        groups = [members[i:i + 4] for i in range(0, len(members), 4)] or [[]]
+        print(f"Batch comparing {len(keywords)} keywords against anchor '{anchor}' in {len(groups)} payloads")
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='trends') as pool:
+            # The anchor's own batch is groups[0] plus the anchor, already fetched
+            rest = groups[1:] if first is not None else groups
+            frames = ([first] if first is not None else []) + list(pool.map(lambda group: fetch([anchor] + group), rest))
+
+        columns = []
+        reference = None
+        failed = []
+        for group, frame in zip(groups, frames):
+            anchor_total = float(frame[anchor].sum()) if frame is not None and not frame.empty else 0.0
+            if anchor_total <= 0:
+                # Without anchor interest the group cannot be put on the common scale
+                failed.extend(group)
+                continue
+            if reference is None:
+                reference = anchor_total
+                columns.append(frame[anchor].astype(float))
+            columns.append(frame[group].astype(float) * (reference / anchor_total))
+
+        if reference is None:
+            return {'status': 'no_data', 'anchor': anchor,
+                    'message': f"Anchor '{anchor}' has no interest - choose a more popular anchor"}
+
+        table = pd.concat(columns, axis=1)
+        peak = table.to_numpy().max()
+        if peak > 0:
+            table = table * (100 / peak)
+
+        with self._span('metrics', 'compute'):
+            metrics = self.trend_metrics(table)
+        metrics = metrics.iloc[np.argsort(-metrics['average_interest'].to_numpy(), kind='stable')]
+        ranked = [{'keyword': keyword, **row} for keyword, row in zip(metrics.index, metrics.to_dict('records'))]
+
+        return {
+            'status': 'success',
+            'anchor': anchor,
+            'keywords': keywords,
+            'payloads': len(groups),
+            'ranked': ranked,
+            'unscaled': failed,
+            'timeframe': timeframe,
+            'compared_at': datetime.now().isoformat()
+        }
+
+    def stored_metrics(self, keywords: Optional[List[str]] = None, start=None, end=None, geo='') -> pd.DataFrame:
+        """trend_metrics over the stored history, without touching the network"""
+        if self.store is None:
+            raise RuntimeError("No trend store configured (requires: pip install pyarrow)")
+        frame = self.store.frame(keywords, start, end, geo)
+        return self.trend_metrics(frame) if not frame.empty else pd.DataFrame()
+
+    @profiled
+    def crawl_related_queries(self, seeds: List[str], max_depth: int = 2, budget: int = 50,
+                              timeframe='today 12-m', geo='') -> Dict:
+        """
+        Expand seed keywords into a graph of related queries, best branches first
+
+        Every fetched keyword's top and rising related queries become
+        edges. Undiscovered targets join a priority frontier: rising
+        queries ordered by their rising value, then top queries by their
+        relative interest. Nothing deeper than `max_depth` hops from a seed
+        is fetched, and no keyword is fetched twice. `budget` caps the
+        network requests spent (cached responses are free). The crawl
+        stops before a keyword whose two requests would exceed it.
+        """
+        normalize = lambda query: ' '.join(str(query).lower().split())
+        nodes: Dict[str, Dict] = {}
+        edges: Dict[str, List] = {}
+        frontier = []
+        order = itertools.count()
+
+        def discover(keyword: str, depth: int, tier: int, value: float):
+            node = nodes.setdefault(keyword, {'depth': depth, 'fetched': False, 'best_rising': None})
+            node['depth'] = min(node['depth'], depth)
+            if tier == 0:
+                node['best_rising'] = max(node['best_rising'] or 0, value)
+            if not node['fetched'] and depth <= max_depth:
+                # Stale duplicates are skipped when popped
+                heapq.heappush(frontier, (tier, -value, next(order), keyword, depth))
+
+        for seed in seeds:
+            discover(normalize(seed), 0, -1, 0)
+
+        spent_before = self.requests
+        fetched = 0
+        while frontier:
+            _, _, _, keyword, depth = heapq.heappop(frontier)
+            node = nodes[keyword]
+            if node['fetched'] or depth > node['depth']:
+                continue
+            cached = (self.cache is not None and
+                      self._cache_key('related_queries', [keyword], timeframe, geo) in self.cache)
+            if not cached and self.requests - spent_before + 2 > budget:
+                print(f"Request budget of {budget} reached with {len(frontier)} queries left in the frontier")
+                break
+
+            print(f"Expanding ({depth}/{max_depth}): {keyword}")
+            node['fetched'] = True
+            fetched += 1
+            try:
+                related = self._fetch('related_queries', [keyword], timeframe, geo)
+            except Exception as e:
+                node['error'] = str(e)
+                continue
+
+            # pytrends keys results by the keyword as Google echoed it
+            tables = related.get(keyword) or next(iter(related.values()), None) or {}
+            edges[keyword] = []
+            for tier, kind in ((0, 'rising'), (1, 'top')):
+                table = tables.get(kind)
+                if table is None:
+                    continue
+                for query, value in zip(table['query'], table['value']):
+                    target = normalize(query)
+                    if target == keyword:
+                        continue
+                    edges[keyword].append((target, kind, int(value)))
+                    if depth < max_depth:
+                        discover(target, depth + 1, tier, float(value))
+                    else:
+                        nodes.setdefault(target, {'depth': depth + 1, 'fetched': False, 'best_rising': None})
+                        if tier == 0:
+                            nodes[target]['best_rising'] = max(nodes[target]['best_rising'] or 0, int(value))
+
+        return {
+            'seeds': [normalize(seed) for seed in seeds],
+            'max_depth': max_depth,
+            'budget': budget,
+            'requests_spent': self.requests - spent_before,
+            'fetched': fetched,
+            'nodes': nodes,
+            'edges': edges,
+            'timeframe': timeframe,
+            'crawled_at': datetime.now().isoformat()
+        }
+
+    @profiled
+    def export_graph(self, graph: Dict, output_dir: str = "output") -> str:
+        """
+        Export a related-query graph as compact adjacency JSON
+
+        "nodes" is a list of [keyword, depth, fetched, best_rising] and
+        "adjacency"[i] lists node i's edges as [target index, kind, value],
+        with kind 'r' for rising and 't' for top queries.
+        """
+        Path(output_dir).mkdir(exist_ok=True)
+        names = sorted(graph['nodes'], key=lambda k: (graph['nodes'][k]['depth'], k))
+        index = {name: i for i, name in enumerate(names)}
+        compact = {
+            'seeds': [index[seed] for seed in graph['seeds']],
+            'nodes': [[name, graph['nodes'][name]['depth'], int(graph['nodes'][name]['fetched']),
+                       graph['nodes'][name]['best_rising']] for name in names],
+            'adjacency': [[[index[target], kind[0], value] for target, kind, value in graph['edges'].get(name, [])]
+                          for name in names],
+            'requests_spent': graph['requests_spent'],
+            'crawled_at': graph['crawled_at'],
+        }
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"{output_dir}/related_graph_{timestamp}.json"
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(compact, f, ensure_ascii=False, separators=(',', ':'))
+
+        print(f"\n✅ Graph exported to: {filename}")
+        return filename
+
+    @classmethod
+    def score_opportunity(cls, metrics: Dict, rising_count: int) -> int:
+        """Opportunity score (0-100) of one keyword's metrics and number of rising queries"""
+        return (cls.INTEREST_POINTS(metrics['average_interest']) +
+                cls.TREND_DIRECTION_POINTS.get(metrics['trend_direction'], 0) +
+                cls.GROWTH_POINTS(metrics['trend_change_percent']) +
+                cls.RISING_QUERY_POINTS(rising_count))
+
+    @classmethod
+    def score_opportunities(cls, metrics: pd.DataFrame) -> pd.DataFrame:
+        """
+        score_opportunity over a table of analyses at once
+
+        `metrics` needs average_interest, trend_direction,
+        trend_change_percent and rising_count columns. Returns
+        opportunity_score and status columns on the same index.
+        """
+        codes, directions = pd.factorize(metrics['trend_direction'])
+        # Missing directions get code -1, which picks the trailing 0
+        directions = np.array([cls.TREND_DIRECTION_POINTS.get(d, 0) for d in directions] + [0], dtype=np.int64)[codes]
+        score = (cls.INTEREST_POINTS.score(metrics['average_interest']) + directions +
+                 cls.GROWTH_POINTS.score(metrics['trend_change_percent']) +
+                 cls.RISING_QUERY_POINTS.score(metrics['rising_count']))
+        return pd.DataFrame({'opportunity_score': score, 'status': cls.OPPORTUNITY_STATUS.categorical(score)},
+                            index=metrics.index)
+
+    @profiled
     def validate_opportunity(self, primary_keyword: str, related_keywords: List[str] = None) -> Dict:
         """Complete validation analysis for a MicroSaaS opportunity"""
         print(f"\n🔍 Validating opportunity: {primary_keyword}")
@@ -166,73 +1101,29 @@ class GoogleTrendsAnalyzer:
 
         # Score the opportunity
         metrics = primary_analysis['metrics']
-        score = 0
-        max_score = 100
-
-        # Interest level (0-40 points)
-        if metrics['average_interest'] >= 75:
-            score += 40
-        elif metrics['average_interest'] >= 50:
-            score += 30
-        elif metrics['average_interest'] >= 25:
-            score += 20
-        elif metrics['average_interest'] >= 10:
-            score += 10
-
-        # Trend direction (0-30 points)
-        if metrics['trend_direction'] == 'rising':
-            score += 30
-        elif metrics['trend_direction'] == 'stable':
-            score += 20
-        elif metrics['trend_direction'] == 'declining':
-            score += 5
-
-        # Growth rate (0-20 points)
-        if metrics['trend_change_percent'] > 50:
-            score += 20
-        elif metrics['trend_change_percent'] > 20:
-            score += 15
-        elif metrics['trend_change_percent'] > 0:
-            score += 10
-        elif metrics['trend_change_percent'] > -20:
-            score += 5
-
-        # Related queries (0-10 points)
-        rising_count = len(primary_analysis['related_queries']['rising'])
-        if rising_count >= 10:
-            score += 10
-        elif rising_count >= 5:
-            score += 7
-        elif rising_count >= 3:
-            score += 5
-
+        with self._span('scoring', 'compute'):
+            score = self.score_opportunity(metrics, len(primary_analysis['related_queries']['rising']))
         validation['opportunity_score'] = score
-
-        # Recommendation
-        if score >= 70:
-            validation['status'] = 'strong'
-            validation['recommendation'] = '✅ Strong opportunity - High demand and positive trends'
-        elif score >= 50:
-            validation['status'] = 'moderate'
-            validation['recommendation'] = '⚠️  Moderate opportunity - Decent demand but watch trends'
-        elif score >= 30:
-            validation['status'] = 'weak'
-            validation['recommendation'] = '❌ Weak opportunity - Low demand or declining trends'
-        else:
-            validation['status'] = 'poor'
-            validation['recommendation'] = '❌ Poor opportunity - Insufficient demand'
+        validation['status'] = self.OPPORTUNITY_STATUS(score)
+        validation['recommendation'] = self.RECOMMENDATIONS[validation['status']]
 
         # Compare with related keywords if provided
         if related_keywords:
-            time.sleep(2)  # Rate limiting
             all_keywords = [primary_keyword] + related_keywords
             comparison = self.compare_keywords(all_keywords)
             validation['keyword_comparison'] = comparison
 
         return validation
 
+    @profiled
     def export_results(self, data: Dict, output_dir: str = "output"):
-        """Export analysis results"""
+        """Export analysis results: into the trend store when there is one, else a per-run JSON file"""
+        if self.store is not None:
+            self.store.compact()
+            filename = self.store.append_analysis(data)
+            print(f"\n✅ Results added to the trend store: {filename}")
+            return str(filename)
+
         Path(output_dir).mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -244,6 +1135,7 @@ class GoogleTrendsAnalyzer:
         print(f"\n✅ Results exported to: {filename}")
         return filename
 
+    @profiled
     def generate_report(self, validation: Dict) -> str:
         """Generate human-readable validation report"""
 
@@ -289,6 +1181,30 @@ Generated: {validation.get('validation_date', 'N/A')}
 """
         return report
 
+    @profiled
+    def generate_batch_report(self, batch: Dict) -> str:
+        """Generate a ranked table from batch_compare results"""
+        if batch.get('status') != 'success':
+            return f"Batch comparison failed: {batch.get('message', batch.get('error', 'unknown error'))}"
+
+        rows = [
+            f"| {rank} | {row['keyword']} | {row['average_interest']} | {row['current_interest']} | "
+            f"{row['max_interest']} | {row['trend_direction']} | {row['trend_change_percent']}% |"
+            for rank, row in enumerate(batch['ranked'], 1)
+        ]
+        table = '\n'.join(rows)
+        unscaled = f"\n**Not comparable** (no anchor interest): {', '.join(batch['unscaled'])}\n" if batch['unscaled'] else ''
+
+        return f"""
+# Google Trends Batch Ranking
+Generated: {batch['compared_at']}
+Anchor: {batch['anchor']} | Keywords: {len(batch['keywords'])} | Payloads: {batch['payloads']}
+
+| # | Keyword | Avg | Current | Peak | Trend | Change |
+|---|---------|-----|---------|------|-------|--------|
+{table}
+{unscaled}"""
+
     def _format_queries(self, queries: List[Dict]) -> str:
         """Format related queries for report"""
         if not queries:
@@ -314,9 +1230,813 @@ Generated: {validation.get('validation_date', 'N/A')}
         return '\n'.join(formatted)
 
 
+class AsyncTrendsAnalyzer:
+    """
+    asyncio front end for GoogleTrendsAnalyzer.
+
+    pytrends is blocking, so its calls run on a thread pool while the event
+    loop schedules them. Google only hands out widget tokens per payload, so
+    a keyword's explore request always comes first. After it, the
+    interest-over-time, related-queries and regional requests go out
+    concurrently on the same session. Up to `concurrency` keywords are in
+    flight at once, each holding one session from a pool. The shared cache,
+    limiter and store all still apply.
+
+    Every endpoint call is bounded by `timeout`. A keyword whose related
+    queries or regions fail still succeeds, and lists what is missing under
+    'missing'. analyze_many() can be given a deadline, after which
+    unfinished keywords are cancelled and reported as such.
+    """
+
+    def __init__(self, analyzer: Optional[GoogleTrendsAnalyzer] = None, concurrency: int = 4,
+                 timeout: float = 30.0):
+        self.analyzer = analyzer or GoogleTrendsAnalyzer()
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=3 * concurrency, thread_name_prefix='trends-async')
+        self._sessions = None
+        self._created = 0
+
+    async def _run(self, func, *args, **kwargs):
+        """Run a blocking call on the pool, giving up on it after `timeout`"""
+        loop = asyncio.get_running_loop()
+        call = loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+        # A timed-out pytrends request cannot be interrupted: its thread
+        # finishes in the background and the result is dropped
+        return await asyncio.wait_for(call, self.timeout)
+
+    async def _acquire(self) -> TrendsSession:
+        if self._sessions is None:
+            self._sessions = asyncio.Queue()
+        if self._sessions.empty() and self._created < self.concurrency:
+            self._created += 1
+            try:
+                # TrendReq fetches a cookie on creation
+                return await self._run(self.analyzer.new_session)
+            except BaseException:
+                self._created -= 1
+                raise
+        return await self._sessions.get()
+
+    async def analyze_keyword(self, keyword: str, timeframe='today 12-m', geo='') -> Dict:
+        """Async analyze_keyword: same result, with the three endpoints fetched concurrently"""
+        print(f"Analyzing: {keyword}")
+        session = await self._acquire()
+        results = ()
+        try:
+            results = over_time, related, regional = await asyncio.gather(*(
+                self._run(self.analyzer._fetch, endpoint, [keyword], timeframe, geo, session=session)
+                for endpoint in ('interest_over_time', 'related_queries', 'interest_by_region')
+            ), return_exceptions=True)
+        finally:
+            if results and not any(isinstance(result, asyncio.TimeoutError) for result in results):
+                self._sessions.put_nowait(session)
+            else:
+                # A request may still be running on it in the background: never reuse it
+                self._created -= 1
+
+        if isinstance(over_time, asyncio.CancelledError):
+            raise over_time
+        if isinstance(over_time, BaseException):
+            return {'keyword': keyword, 'status': 'error', 'error': self._describe(over_time)}
+        if over_time.empty:
+            return self.analyzer._no_data(keyword)
+
+        missing = [name for name, result in (('related_queries', related), ('regional_interest', regional))
+                   if isinstance(result, BaseException)]
+        analysis = self.analyzer._analysis(
+            keyword, timeframe, over_time,
+            None if isinstance(related, BaseException) else related,
+            None if isinstance(regional, BaseException) else regional
+        )
+        if missing:
+            analysis['missing'] = missing
+        return analysis
+
+    @staticmethod
+    def _describe(error: BaseException) -> str:
+        if isinstance(error, asyncio.TimeoutError):
+            return 'timed out'
+        return str(error) or type(error).__name__
+
+    async def analyze_many(self, keywords: List[str], timeframe='today 12-m', geo='',
+                           deadline: Optional[float] = None) -> List[Dict]:
+        """
+        Analyze many keywords, `concurrency` at a time, in input order
+
+        Keywords still running when `deadline` seconds have passed are
+        cancelled and come back with status 'cancelled'.
+        """
+        keywords = list(keywords)
+        if not keywords:
+            # asyncio.wait() rejects an empty set of tasks
+            return []
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(keyword: str) -> Dict:
+            async with semaphore:
+                return await self.analyze_keyword(keyword, timeframe, geo)
+
+        tasks = [asyncio.create_task(bounded(keyword)) for keyword in keywords]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for keyword, task in zip(keywords, tasks):
+            if task.cancelled():
+                results.append({'keyword': keyword, 'status': 'cancelled', 'error': 'deadline reached'})
+            elif task.exception() is not None:
+                results.append({'keyword': keyword, 'status': 'error', 'error': self._describe(task.exception())})
+            else:
+                results.append(task.result())
+        return results
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@dataclass
+class TrendState:
+    """
+    Running trend statistics of one keyword's complete weekly interest points.
+
+    `window` keeps the last 24 weeks (on the scale of the first pull), which
+    is all the 12-vs-12 comparison needs. The EWMA, its exponentially
+    weighted variance and a two-sided CUSUM on the standardized deviation
+    from the EWMA are updated in O(1) per week.
+    """
+
+    keyword: str
+    geo: str = ''
+    last_week: Optional[str] = None
+    window: List[float] = field(default_factory=list)
+    weeks: int = 0
+    ewma: float = 0.0
+    ewm_var: float = 0.0
+    cusum_up: float = 0.0
+    cusum_down: float = 0.0
+    change_point: Optional[Dict] = None
+
+    WINDOW = 12
+    # EWMA smoothing factor per week
+    ALPHA = 0.3
+    # CUSUM slack and alarm threshold, in standard deviations
+    CUSUM_K = 0.5
+    CUSUM_H = 4.0
+    # Two-sided 5% critical values of Student's t by degrees of freedom;
+    # others are interpolated in 1/df (inf is the normal 1.960)
+    T_CRITICAL = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262,
+                  10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110,
+                  18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060,
+                  26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+                  math.inf: 1.960}
+
+    @classmethod
+    def t_critical(cls, df: float) -> float:
+        """Two-sided 5% critical value of t at (fractional) `df` degrees of freedom"""
+        df = max(df, 1.0)
+        points = list(cls.T_CRITICAL.items())
+        for (low, low_value), (high, high_value) in zip(points, points[1:]):
+            if df <= high:
+                if high == math.inf:
+                    return low_value + (high_value - low_value) * (1 - low / df)
+                return low_value + (high_value - low_value) * (1 / low - 1 / df) / (1 / low - 1 / high)
+        return points[-1][1]
+
+    def fold(self, week: pd.Timestamp, value: float):
+        """Add the next complete week"""
+        self.window.append(float(value))
+        del self.window[:-2 * self.WINDOW]
+
+        if self.weeks == 0:
+            self.ewma = float(value)
+        else:
+            deviation = value - self.ewma
+            # Standardize against the estimate before this week, once it has settled
+            if self.weeks >= 4 and self.ewm_var > 0:
+                z = deviation / math.sqrt(self.ewm_var)
+                self.cusum_up = max(0.0, self.cusum_up + z - self.CUSUM_K)
+                self.cusum_down = max(0.0, self.cusum_down - z - self.CUSUM_K)
+                if self.cusum_up > self.CUSUM_H or self.cusum_down > self.CUSUM_H:
+                    self.change_point = {'week': week.strftime('%Y-%m-%d'),
+                                         'direction': 'up' if self.cusum_up > self.CUSUM_H else 'down'}
+                    self.cusum_up = self.cusum_down = 0.0
+            increment = self.ALPHA * deviation
+            self.ewma += increment
+            self.ewm_var = (1 - self.ALPHA) * (self.ewm_var + deviation * increment)
+
+        self.weeks += 1
+        self.last_week = week.strftime('%Y-%m-%d')
+
+    def metrics(self) -> Dict:
+        """Trend direction as analyze_keyword reports it, plus the statistical signals"""
+        window = np.array(self.window)
+        result = {
+            'weeks': self.weeks,
+            'last_week': self.last_week,
+            'trend_direction': 'insufficient_data',
+            'trend_change_percent': 0,
+            'trend_signal': 'insufficient_data',
+            't_statistic': None,
+            'ewma': round(self.ewma, 2),
+            'change_point': self.change_point,
+        }
+        if len(window) < 2 * self.WINDOW:
+            return result
+
+        recent, previous = window[-self.WINDOW:], window[:self.WINDOW]
+        recent_mean, previous_mean = recent.mean(), previous.mean()
+        result['trend_direction'] = ('rising' if recent_mean > previous_mean
+                                     else 'declining' if recent_mean < previous_mean else 'stable')
+        change = ((recent_mean - previous_mean) / previous_mean * 100) if previous_mean > 0 else 0
+        result['trend_change_percent'] = round(change, 2)
+
+        # Welch's t-test: is the recent quarter's mean really different?
+        # Degrees of freedom by Welch-Satterthwaite: 11 to 22 for two 12-week samples
+        recent_error, previous_error = recent.var(ddof=1) / self.WINDOW, previous.var(ddof=1) / self.WINDOW
+        spread = math.sqrt(recent_error + previous_error)
+        t = (recent_mean - previous_mean) / spread if spread > 0 else 0.0
+        df = ((recent_error + previous_error) ** 2 / ((recent_error ** 2 + previous_error ** 2) / (self.WINDOW - 1))
+              if spread > 0 else 2 * self.WINDOW - 2)
+        critical = self.t_critical(df)
+        result['t_statistic'] = round(float(t), 2)
+        result['trend_signal'] = ('rising' if t > critical
+                                  else 'declining' if t < -critical else 'flat')
+        return result
+
+
+class TrendMonitor:
+    """
+    Incremental trend monitoring backed by per-keyword TrendState in SQLite.
+
+    A new keyword is seeded from one 12-month pull. After that, a refresh
+    fetches nothing until a new week has completed. Then it pulls only a
+    short window that starts OVERLAP_WEEKS before the last folded week.
+    Trends scales every pull to its own peak, so the new weeks are rescaled
+    by the ratio of stored to fetched interest over the overlap before
+    they are folded in. Short windows come back daily and are averaged
+    into Sunday-based weeks.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS states (
+            keyword TEXT NOT NULL,
+            geo TEXT NOT NULL,
+            state TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (keyword, geo)
+        );
+    """
+    OVERLAP_WEEKS = 4
+
+    def __init__(self, path: str = "output/trend_monitor.db"):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    def load(self, keyword: str, geo: str = '') -> Optional[TrendState]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM states WHERE keyword = ? AND geo = ?", (keyword, geo)
+            ).fetchone()
+        return TrendState(**json.loads(row[0])) if row else None
+
+    def save(self, state: TrendState):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO states (keyword, geo, state, updated_at) VALUES (?, ?, ?, ?)",
+                (state.keyword, state.geo, json.dumps(asdict(state)), datetime.now().isoformat())
+            )
+
+    @staticmethod
+    def _complete_weeks(series: pd.Series, partial: pd.Series, today: pd.Timestamp) -> pd.Series:
+        """Complete Sunday-based weeks of a daily or weekly interest series"""
+        series = series[~partial.astype(bool)]
+        if len(series) > 1 and series.index[1] - series.index[0] < pd.Timedelta(days=7):
+            starts = series.index - pd.to_timedelta((series.index.dayofweek + 1) % 7, unit='D')
+            grouped = series.groupby(starts)
+            series = grouped.mean()[grouped.size() == 7]
+        return series[series.index + pd.Timedelta(days=7) <= today]
+
+    def refresh_keyword(self, analyzer: 'GoogleTrendsAnalyzer', keyword: str, geo: str = '',
+                        today: Optional[datetime] = None) -> Dict:
+        """Fold any newly completed weeks of `keyword` into its state and return its metrics"""
+        today = pd.Timestamp(today or datetime.now()).normalize()
+        # Start of the newest week that has completed by today
+        last_complete = today - pd.Timedelta(days=(today.dayofweek + 1) % 7 + 7)
+        state = self.load(keyword, geo)
+        fetched = False
+
+        if state is None or state.last_week is None:
+            # Not seeded yet, or the seed pull had no complete weeks: pull the 12 months again
+            frame = analyzer._fetch('interest_over_time', [keyword], 'today 12-m', geo)
+            fetched = True
+            state = TrendState(keyword=keyword, geo=geo)
+            if not frame.empty:
+                for week, value in self._complete_weeks(frame[keyword], frame['isPartial'], today).items():
+                    state.fold(week, value)
+        elif pd.Timestamp(state.last_week) < last_complete:
+            last_week = pd.Timestamp(state.last_week)
+            start = last_week - pd.Timedelta(weeks=self.OVERLAP_WEEKS - 1)
+            frame = analyzer._fetch('interest_over_time', [keyword], f"{start:%Y-%m-%d} {today:%Y-%m-%d}", geo)
+            fetched = True
+            weekly = (self._complete_weeks(frame[keyword], frame['isPartial'], today)
+                      if not frame.empty else pd.Series(dtype=float))
+            overlap = [week for week in weekly.index if week <= last_week]
+            known = {last_week - pd.Timedelta(weeks=i): value for i, value in enumerate(reversed(state.window))}
+            stored_total = sum(known.get(week, 0.0) for week in overlap)
+            fetched_total = float(weekly[overlap].sum()) if overlap else 0.0
+            if fetched_total > 0:
+                scale = stored_total / fetched_total
+            elif stored_total == 0:
+                scale = 1.0
+            else:
+                scale = None
+                print(f"⚠️  {keyword}: no interest in the overlap window, cannot rescale new weeks")
+            if scale is not None:
+                for week, value in weekly[weekly.index > last_week].items():
+                    state.fold(week, value * scale)
+
+        if fetched:
+            self.save(state)
+        return {'keyword': keyword, 'fetched': fetched, **state.metrics()}
+
+    def refresh(self, analyzer: 'GoogleTrendsAnalyzer', keywords: List[str], geo: str = '',
+                today: Optional[datetime] = None, workers: int = 4) -> List[Dict]:
+        """refresh_keyword for many keywords, fetched concurrently under the analyzer's limiter"""
+        def refresh_one(keyword: str) -> Dict:
+            try:
+                return self.refresh_keyword(analyzer, keyword, geo, today)
+            except Exception as e:
+                return {'keyword': keyword, 'fetched': False, 'error': str(e)}
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='trends-monitor') as pool:
+            return list(pool.map(refresh_one, keywords))
+
+    def close(self):
+        self._conn.close()
+
+
+class StubTrendsServer:
+    """
+    Local HTTP server that speaks the Google Trends wire protocol with canned data.
+
+    Use it as a context manager: while it runs, pytrends is pointed at it.
+    The server runs in-process, so its threads share the GIL with the
+    client's response parsing.
+    Every request sleeps `latency` seconds, and every `rate_limit_every`-th
+    request is answered with a 429. Series, related queries and regions are
+    derived from the keyword, so repeated runs return the same data.
+    """
+
+    def __init__(self, latency: float = 0.0, rate_limit_every: int = 0, today: Optional[datetime] = None):
+        self.latency = latency
+        self.rate_limit_every = rate_limit_every
+        self.today = pd.Timestamp(today or datetime.now()).normalize()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._patched = {}
+
+    @staticmethod
+    def _rng(keyword: str) -> np.random.Generator:
+        return np.random.default_rng(zlib.crc32(keyword.encode('utf-8')))
+
+    def _explore(self, query: Dict) -> Dict:
+        request = json.loads(query['req'][0])
+        items = request['comparisonItem']
+        keywords = [item['keyword'] for item in items]
+        restriction = {'time': items[0]['time'], 'geo': items[0]['geo']}
+        widgets = [
+            {'id': 'TIMESERIES', 'token': 'stub', 'request': {'keywords': keywords, **restriction}},
+            {'id': 'GEO_MAP', 'token': 'stub', 'request': {'keywords': keywords, **restriction}},
+        ]
+        for i, keyword in enumerate(keywords):
+            widgets.append({'id': f'RELATED_QUERIES_{i}', 'token': 'stub', 'request': {
+                'restriction': {'complexKeywordsRestriction': {'keyword': [{'value': keyword}]}}}})
+        return {'widgets': widgets}
+
+    def _daily_interest(self, keyword: str, days: pd.DatetimeIndex) -> np.ndarray:
+        """Deterministic daily search volume: trend, yearly season and day-to-day noise"""
+        rng = self._rng(keyword)
+        base, slope, phase = rng.uniform(5, 60), rng.normal(0, 0.0015), rng.uniform(0, 2 * np.pi)
+        t = (days - pd.Timestamp('2020-01-01')).days.to_numpy(dtype=np.float64)
+        noise = np.modf(np.abs(np.sin(t * 12.9898 + zlib.crc32(keyword.encode('utf-8')) % 1000) * 43758.5453))[0]
+        return np.clip(base * (1 + slope * t) * (1 + 0.25 * np.sin(2 * np.pi * t / 365 + phase))
+                       * (0.8 + 0.4 * noise), 0, None)
+
+    def _window(self, timeframe: str):
+        """Days covered by a Trends timeframe, and whether Google would answer weekly"""
+        if timeframe.startswith('today '):
+            amount, unit = timeframe.split()[1].split('-')
+            start = self.today - (pd.DateOffset(years=int(amount)) if unit == 'y' else pd.DateOffset(months=int(amount)))
+        else:
+            start, end = (pd.Timestamp(part) for part in timeframe.split())
+            return pd.date_range(start, min(end, self.today)), (end - start).days > 269
+        return pd.date_range(start, self.today), True
+
+    def _timeline(self, request: Dict) -> Dict:
+        days, weekly = self._window(request['time'])
+        raw = np.array([self._daily_interest(keyword, days) for keyword in request['keywords']])
+        if weekly:
+            # Weeks start on Sunday; the running week is reported as partial
+            starts = days - pd.to_timedelta((days.dayofweek + 1) % 7, unit='D')
+            periods = pd.DatetimeIndex(starts.unique())
+            raw = np.array([pd.Series(row).groupby(starts).mean().to_numpy() for row in raw])
+            partial = periods[-1] + pd.Timedelta(days=6) > self.today
+        else:
+            periods = days
+            partial = True
+        peak = raw.max() or 1
+        values = np.round(raw * 100 / peak).astype(int)
+        return {'default': {'timelineData': [
+            {'time': str(int(period.timestamp())), 'value': values[:, i].tolist(),
+             'isPartial': bool(partial and i == len(periods) - 1)}
+            for i, period in enumerate(periods)
+        ]}}
+
+    def _related(self, request: Dict) -> Dict:
+        keyword = request['restriction']['complexKeywordsRestriction']['keyword'][0]['value']
+        rng = self._rng(keyword)
+        top = [{'query': f"{keyword} {word}", 'value': int(v)} for word, v in
+               zip(('app', 'software', 'free', 'template', 'online', 'best', 'tool', 'pricing', 'ai', 'open source',
+                    'alternative', 'review'), sorted(rng.integers(5, 100, 12), reverse=True))]
+        rising = [{'query': f"{keyword} {word}", 'value': int(v)} for word, v in
+                  zip(('ai', 'agent', 'gpt', '2025', 'automation', 'api', 'mobile'),
+                      sorted(rng.integers(50, 5000, rng.integers(0, 8)), reverse=True))]
+        return {'default': {'rankedList': [{'rankedKeyword': top}, {'rankedKeyword': rising}]}}
+
+    def _regions(self, request: Dict) -> Dict:
+        names = ['United States', 'United Kingdom', 'Canada', 'Australia', 'Germany', 'India', 'France']
+        values = np.array([self._rng(k + 'geo').integers(0, 100, len(names)) for k in request['keywords']])
+        return {'default': {'geoMapData': [
+            {'geoName': name, 'geoCode': name[:2].upper(), 'value': values[:, i].tolist()}
+            for i, name in enumerate(names)
+        ]}}
+
+    def _handler(self):
+        stub = self
+        routes = {
+            '/trends/api/explore': (self._explore, ")]}'\n"),
+            '/trends/api/widgetdata/multiline': (lambda q: self._timeline(json.loads(q['req'][0])), ")]}',\n"),
+            '/trends/api/widgetdata/relatedsearches': (lambda q: self._related(json.loads(q['req'][0])), ")]}',\n"),
+            '/trends/api/widgetdata/comparedgeo': (lambda q: self._regions(json.loads(q['req'][0])), ")]}',\n"),
+        }
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urllib.parse.urlsplit(self.path)
+                with stub._lock:
+                    stub.requests += 1
+                    throttled = bool(stub.rate_limit_every) and stub.requests % stub.rate_limit_every == 0
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if url.path.startswith('/trends/explore'):
+                    # Cookie bootstrap done by TrendReq.__init__
+                    self.send_response(200)
+                    self.send_header('Set-Cookie', 'NID=stub; Path=/')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if throttled or url.path not in routes:
+                    self.send_response(429 if throttled else 404)
+                    self.send_header('Content-Type', 'text/html')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                build, prefix = routes[url.path]
+                body = (prefix + json.dumps(build(urllib.parse.parse_qs(url.query)))).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> 'StubTrendsServer':
+        self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        base = f"http://127.0.0.1:{self._server.server_address[1]}/trends"
+
+        # pytrends reads its endpoints from module and class constants
+        import pytrends.request
+        self._patched = {(pytrends.request, 'BASE_TRENDS_URL'): pytrends.request.BASE_TRENDS_URL}
+        for name in ('GENERAL_URL', 'INTEREST_OVER_TIME_URL', 'INTEREST_BY_REGION_URL', 'RELATED_QUERIES_URL'):
+            self._patched[(pytrends.request.TrendReq, name)] = getattr(pytrends.request.TrendReq, name)
+        upstream = pytrends.request.BASE_TRENDS_URL
+        for (owner, name), url in self._patched.items():
+            setattr(owner, name, url.replace(upstream, base))
+        return self
+
+    def __exit__(self, *exc):
+        for (owner, name), url in self._patched.items():
+            setattr(owner, name, url)
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def render_report(path: str) -> str:
+    """
+    Render an exported validation or batch ranking as markdown
+
+    Needs neither pandas nor pytrends, and never touches the network, so
+    short-lived report jobs skip the analyzer's heavy startup entirely.
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    analyzer = GoogleTrendsAnalyzer(cache_path=None)
+    if 'primary_keyword' in data:
+        return analyzer.generate_report(data)
+    if 'ranked' in data or 'anchor' in data:
+        return analyzer.generate_batch_report(data)
+    raise ValueError(f"{path} is neither an exported validation nor a batch ranking")
+
+
+def benchmark_import(runs: int = 5) -> Dict:
+    """Time module import and a report-only run in fresh interpreters, against importing everything eagerly"""
+    import subprocess
+    import statistics
+    import tempfile
+
+    validation = {
+        'primary_keyword': 'ai note taking', 'validation_date': datetime.now().isoformat(), 'status': 'strong',
+        'opportunity_score': 75, 'recommendation': GoogleTrendsAnalyzer.RECOMMENDATIONS['strong'],
+        'primary_analysis': {
+            'keyword': 'ai note taking', 'status': 'success',
+            'metrics': {'current_interest': 81, 'average_interest': 64, 'max_interest': 100, 'min_interest': 31,
+                        'trend_direction': 'rising', 'trend_change_percent': 38.5},
+            'related_queries': {'top': [{'query': 'ai note taking app', 'value': 100}],
+                                'rising': [{'query': 'ai note taking free', 'value': 450}]},
+            'regional_interest': {'United States': 100, 'Canada': 74},
+        },
+    }
+    heavy = ('numpy', 'pandas', 'pytrends', 'pyarrow')
+    load = ("import importlib.util, json, sys, time\n"
+            "started = time.perf_counter()\n"
+            f"spec = importlib.util.spec_from_file_location('trends_analyzer', {os.path.abspath(__file__)!r})\n"
+            "module = importlib.util.module_from_spec(spec)\n"
+            "sys.modules['trends_analyzer'] = module\n"
+            "spec.loader.exec_module(module)\n")
+    done = f"print(json.dumps([time.perf_counter() - started, [m for m in {heavy!r} if m in sys.modules]]))\n"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        report_path = os.path.join(tmp, 'validation.json')
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(validation, f)
+        scenarios = {
+            'import': load + done,
+            'report only': load + f"module.render_report({report_path!r})\n" + done,
+            'eager imports': load + "import numpy, pandas, pytrends.request\n"
+                                    "if importlib.util.find_spec('pyarrow'): import pyarrow.compute, pyarrow.ipc\n" + done,
+        }
+        results = {}
+        for name, code in scenarios.items():
+            timings = []
+            for _ in range(runs):
+                output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+                seconds, loaded = json.loads(output.stdout.strip().splitlines()[-1])
+                timings.append(seconds)
+            results[name] = {'median_seconds': round(statistics.median(timings), 4), 'heavy_modules': loaded}
+            print(f"{name:<14} {statistics.median(timings) * 1000:8.1f} ms  heavy modules: {', '.join(loaded) or 'none'}")
+
+    assert not results['report only']['heavy_modules'], "the report-only path imported heavy dependencies"
+    return results
+
+
+def benchmark_metrics(num_keywords: int = 10_000, weeks: int = 52, seed: int = 42) -> Dict:
+    """Compare per-keyword metrics with the vectorized trend_metrics on a wide interest frame"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=datetime.now(), periods=weeks, freq='W')
+    walk = rng.uniform(5, 80, num_keywords) + np.cumsum(rng.normal(0, 4, (weeks, num_keywords)), axis=0)
+    columns = [f"keyword {i}" for i in range(num_keywords)]
+    frames = {
+        # Raw Trends payloads are integers; batch tables are rescaled floats
+        'integer': pd.DataFrame(np.clip(walk, 0, 100).round().astype(np.int64), index=index, columns=columns),
+        'float': pd.DataFrame(np.clip(walk, 0, 100) * 0.73, index=index, columns=columns),
+    }
+
+    results = {}
+    for name, frame in frames.items():
+        started = time.perf_counter()
+        previous = {keyword: GoogleTrendsAnalyzer._series_metrics(frame[keyword]) for keyword in frame.columns}
+        previous_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        metrics = GoogleTrendsAnalyzer.trend_metrics(frame)
+        vectorized_seconds = time.perf_counter() - started
+
+        current = dict(zip(metrics.index, metrics.to_dict('records')))
+        assert current == previous, "vectorized metrics differ from the per-keyword path"
+        results[name] = {'previous_seconds': round(previous_seconds, 4),
+                         'vectorized_seconds': round(vectorized_seconds, 4)}
+        print(f"{num_keywords:,} {name} series x {weeks} weeks: per keyword {previous_seconds:7.3f}s | "
+              f"vectorized {vectorized_seconds:7.4f}s ({previous_seconds / vectorized_seconds:,.0f}x)")
+
+    return results
+
+
+def benchmark_scoring(num_analyses: int = 1_000_000, seed: int = 42) -> Dict:
+    """Compare per-analysis score_opportunity with the vectorized score_opportunities"""
+    rng = np.random.default_rng(seed)
+    metrics = pd.DataFrame({
+        'average_interest': rng.integers(0, 101, num_analyses),
+        'trend_direction': rng.choice(['rising', 'stable', 'declining', 'insufficient_data'], num_analyses),
+        'trend_change_percent': rng.normal(0, 40, num_analyses).round(2),
+        'rising_count': rng.integers(0, 26, num_analyses),
+    })
+
+    started = time.perf_counter()
+    records = metrics.to_dict('records')
+    previous = [GoogleTrendsAnalyzer.score_opportunity(row, row['rising_count']) for row in records]
+    statuses = [GoogleTrendsAnalyzer.OPPORTUNITY_STATUS(score) for score in previous]
+    previous_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scored = GoogleTrendsAnalyzer.score_opportunities(metrics)
+    vectorized_seconds = time.perf_counter() - started
+
+    assert scored['opportunity_score'].tolist() == previous, "vectorized scores differ from the per-analysis path"
+    assert scored['status'].tolist() == statuses, "vectorized statuses differ from the per-analysis path"
+    print(f"{num_analyses:,} analyses: per analysis {previous_seconds:.2f}s | vectorized {vectorized_seconds:.3f}s "
+          f"({previous_seconds / vectorized_seconds:,.0f}x)")
+    return {'previous_seconds': round(previous_seconds, 4), 'vectorized_seconds': round(vectorized_seconds, 4)}
+
+
+def benchmark_async(num_keywords: int = 24, latency: float = 0.1, concurrency: int = 8) -> Dict:
+    """Time sequential vs async analysis of the same keywords against a StubTrendsServer"""
+    keywords = [f"stub keyword {i}" for i in range(num_keywords)]
+    results = {}
+    with StubTrendsServer(latency=latency) as server:
+        analyzer = GoogleTrendsAnalyzer(cache_path=None)
+
+        started = time.perf_counter()
+        sequential = [analyzer.analyze_keyword(keyword) for keyword in keywords]
+        results['sequential_seconds'] = time.perf_counter() - started
+        sequential_requests = server.requests
+
+        async_analyzer = AsyncTrendsAnalyzer(GoogleTrendsAnalyzer(cache_path=None),
+                                             concurrency=concurrency)
+        started = time.perf_counter()
+        concurrent = asyncio.run(async_analyzer.analyze_many(keywords))
+        results['async_seconds'] = time.perf_counter() - started
+        async_analyzer.close()
+
+    strip = lambda analysis: {k: v for k, v in analysis.items() if k != 'analyzed_at'}
+    assert [strip(a) for a in concurrent] == [strip(a) for a in sequential], "async results differ"
+    print(f"{num_keywords} keywords at {latency * 1000:.0f} ms/request: sequential {results['sequential_seconds']:.2f}s "
+          f"({sequential_requests} requests) | async x{concurrency} {results['async_seconds']:.2f}s "
+          f"({results['sequential_seconds'] / results['async_seconds']:.1f}x)")
+    return results
+
+
 def main():
     """Main execution"""
-    analyzer = GoogleTrendsAnalyzer()
+    parser = argparse.ArgumentParser(description="Validate MicroSaaS demand with Google Trends")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="rank the keywords in FILE (one per line) on a common scale")
+    parser.add_argument('--anchor', help="anchor keyword shared by every batch payload (default: highest peak of the first five)")
+    parser.add_argument('--workers', type=int, default=4, help="payloads fetched concurrently (default: 4)")
+    parser.add_argument('--analyze', metavar='FILE',
+                        help="analyze every keyword in FILE (one per line) concurrently and export the results")
+    parser.add_argument('--concurrency', type=int, default=4, help="keywords analyzed at once with --analyze (default: 4)")
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help="cancel keywords still running after SECONDS with --analyze")
+    parser.add_argument('--benchmark-async', action='store_true',
+                        help="benchmark sequential vs async analysis against a local stub server and exit")
+    parser.add_argument('--monitor', metavar='FILE',
+                        help="fold newly completed weeks of the keywords in FILE into their running trend state")
+    parser.add_argument('--monitor-db', default='output/trend_monitor.db', metavar='PATH',
+                        help="trend state database for --monitor (default: output/trend_monitor.db)")
+    parser.add_argument('--crawl', nargs='+', metavar='SEED',
+                        help="expand SEED keywords into a related-query graph and export it")
+    parser.add_argument('--depth', type=int, default=2, help="hops from the seeds to expand with --crawl (default: 2)")
+    parser.add_argument('--budget', type=int, default=50,
+                        help="maximum network requests spent by --crawl (default: 50)")
+    parser.add_argument('--store', nargs='?', const='output/trends_store', metavar='PATH',
+                        help="keep every interest-over-time pull, and the exported results, in a trend "
+                             "store at PATH (default: output/trends_store)")
+    parser.add_argument('--stored', nargs='*', metavar='KEYWORD',
+                        help="print metrics of the stored trend history (all keywords when none given) and exit")
+    parser.add_argument('--compact-store', action='store_true',
+                        help="merge the trend store's segments into its base file and exit")
+    parser.add_argument('--profile', nargs='?', const='', metavar='TRACE',
+                        help="time every phase, print a summary and write a Chrome trace to TRACE "
+                             "(default: output/trends_trace_<timestamp>.json)")
+    parser.add_argument('--report', metavar='FILE',
+                        help="print the markdown report of an exported validation or batch ranking and exit")
+    parser.add_argument('--benchmark-import', action='store_true',
+                        help="benchmark import and report-only startup in fresh interpreters and exit")
+    parser.add_argument('--benchmark-scoring', type=int, metavar='N', nargs='?', const=1_000_000,
+                        help="benchmark opportunity scoring over N stored analyses and exit")
+    parser.add_argument('--benchmark-metrics', type=int, metavar='N', nargs='?', const=10_000,
+                        help="benchmark trend metrics over N keyword series and exit")
+    args = parser.parse_args()
+
+    if args.report:
+        print(render_report(args.report))
+        return
+    if args.benchmark_import:
+        benchmark_import()
+        return
+    if args.benchmark_metrics:
+        benchmark_metrics(args.benchmark_metrics)
+        return
+    if args.benchmark_async:
+        benchmark_async()
+        return
+    if args.benchmark_scoring:
+        benchmark_scoring(args.benchmark_scoring)
+        return
+
+    store = args.store
+    if store is None and (args.compact_store or args.stored is not None):
+        store = 'output/trends_store'
+    analyzer = GoogleTrendsAnalyzer(store_path=store)
+    if args.profile is not None:
+        analyzer.enable_profiling()
+    try:
+        run(analyzer, args)
+    finally:
+        if analyzer.profiler is not None:
+            print(f"\n{analyzer.profiler.report()}")
+            trace = args.profile or f"output/trends_trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            print(f"\n✅ Trace written to: {analyzer.profiler.export_trace(trace)}")
+
+
+def run(analyzer: GoogleTrendsAnalyzer, args: argparse.Namespace):
+    """Run the mode selected on the command line"""
+    if (args.compact_store or args.stored is not None) and analyzer.store is None:
+        print("⚠️  The trend store requires: pip install pyarrow")
+        return
+    if args.compact_store:
+        analyzer.store.compact()
+        return
+    if args.stored is not None:
+        print(analyzer.stored_metrics(args.stored or None).to_string())
+        return
+
+    if args.crawl:
+        graph = analyzer.crawl_related_queries(args.crawl, max_depth=args.depth, budget=args.budget)
+        rising = sorted(((node['best_rising'], name) for name, node in graph['nodes'].items()
+                         if node['best_rising']), reverse=True)[:15]
+        print(f"\n{len(graph['nodes'])} queries, {graph['fetched']} expanded, "
+              f"{graph['requests_spent']} requests spent")
+        for value, name in rising:
+            print(f"- {name} (+{value}%)")
+        analyzer.export_graph(graph)
+        return
+    if args.monitor:
+        with open(args.monitor, encoding='utf-8') as f:
+            keywords = [line.strip() for line in f if line.strip()]
+        monitor = TrendMonitor(args.monitor_db)
+        results = monitor.refresh(analyzer, keywords, workers=args.workers)
+        monitor.close()
+        print(f"{'Keyword':<32} {'Weeks':>5} {'Direction':<12} {'Change':>8} {'t':>6} {'Signal':<10} Change point")
+        for row in results:
+            if 'error' in row:
+                print(f"{row['keyword']:<32} error: {row['error']}")
+                continue
+            point = row['change_point']
+            print(f"{row['keyword']:<32} {row['weeks']:>5} {row['trend_direction']:<12} "
+                  f"{row['trend_change_percent']:>7}% {row['t_statistic'] if row['t_statistic'] is not None else '-':>6} "
+                  f"{row['trend_signal']:<10} {point['direction'] + ' ' + point['week'] if point else '-'}")
+        print(f"\n{sum(row['fetched'] for row in results)} of {len(results)} keywords needed a request")
+        return
+    if args.analyze:
+        with open(args.analyze, encoding='utf-8') as f:
+            keywords = [line.strip() for line in f if line.strip()]
+        async_analyzer = AsyncTrendsAnalyzer(analyzer, concurrency=args.concurrency)
+        analyses = asyncio.run(async_analyzer.analyze_many(keywords, deadline=args.deadline))
+        async_analyzer.close()
+        statuses = {}
+        for analysis in analyses:
+            statuses[analysis['status']] = statuses.get(analysis['status'], 0) + 1
+        print(f"Analyzed {len(analyses)} keywords: {statuses}")
+        analyzer.export_results({'analyses': analyses, 'analyzed_at': datetime.now().isoformat()})
+        return
+    if args.batch:
+        with open(args.batch, encoding='utf-8') as f:
+            keywords = [line.strip() for line in f if line.strip()]
+        batch = analyzer.batch_compare(keywords, anchor=args.anchor, workers=args.workers)
+        print(analyzer.generate_batch_report(batch))
+        analyzer.export_results(batch)
+        return
 
     # Example: Validate a MicroSaaS opportunity
     print("🔍 Google Trends Validation")
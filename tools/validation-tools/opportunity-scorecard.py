@@ -4,12 +4,38 @@ Opportunity Scorecard - Hermetic Agent: Chronos
 Automated scoring of MicroSaaS opportunities using the Hermetic viability framework
 """
 
+import argparse
+import bisect
+import gzip
+import heapq
+import io
+import itertools
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import operator
+import os
+import random
+import re
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass, asdict
 
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # only needed for bulk scoring
+    np = pd = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # only needed for Parquet results
+    pyarrow = None
+
 @dataclass
 class OpportunityScore:
     """Data class for opportunity scoring"""
@@ -39,6 +65,744 @@ class OpportunityScore:
             self.scored_at = datetime.now().isoformat()
 
 
+class InsightLadder:
+    """
+    An if/elif ladder over one number that returns (points, insight)
+
+    `rungs` are (operator, threshold, points, insight) tried in order, and
+    `default` (points, insight) applies when none holds; insights may use
+    {value}. It is compiled like ScoreLadder in google-trends-analyzer.py,
+    one table entry per threshold, per interval around them and for NaN,
+    except that entries carry their insight as well as their points.
+    """
+
+    OPERATORS = {'>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt, '==': operator.eq}
+
+    def __init__(self, rungs: List[tuple], default: tuple = (0, None)):
+        self.edges = sorted({threshold for _, threshold, _, _ in rungs})
+        # Region 2i is the interval below edges[i], 2i + 1 is edges[i] itself, then above and NaN
+        probes = [self.edges[0] - 1]
+        for low, high in zip(self.edges, self.edges[1:] + [self.edges[-1] + 2]):
+            probes += [low, (low + high) / 2]
+        self.table = [next(((points, insight) for op, threshold, points, insight in rungs
+                            if self.OPERATORS[op](value, threshold)), default)
+                      for value in probes + [float('nan')]]
+
+    def region(self, value) -> int:
+        if value != value:
+            return len(self.table) - 1
+        return bisect.bisect_left(self.edges, value) + bisect.bisect_right(self.edges, value)
+
+    def __call__(self, value) -> tuple:
+        """(points, insight) for one value"""
+        points, insight = self.table[self.region(value)]
+        return points, insight.format(value=value) if insight else None
+
+    def regions(self, values) -> 'np.ndarray':
+        """region() of every value in an array"""
+        values = np.asarray(values, dtype=float)
+        regions = np.searchsorted(self.edges, values, 'left') + np.searchsorted(self.edges, values, 'right')
+        regions[np.isnan(values)] = len(self.table) - 1
+        return regions
+
+    def score(self, values) -> 'np.ndarray':
+        """Points for every value in an array"""
+        return np.array([points for points, _ in self.table])[self.regions(values)]
+
+
+class ScoreTable:
+    """
+    A ladder of equality tests on one categorical input, compiled into a dict
+
+    `choices` maps a value (or a tuple of values sharing a rung) to
+    (points, insight); `default` applies to anything else.
+    """
+
+    def __init__(self, choices: Dict, default: tuple = (0, None)):
+        self.choices = {key: rung for keys, rung in choices.items()
+                        for key in (keys if isinstance(keys, tuple) else (keys,))}
+        self.default = default
+
+    def __call__(self, value) -> tuple:
+        """(points, insight) for one value"""
+        return self.choices.get(value, self.default)
+
+
+class ScoredBatch:
+    """
+    Columnar scores of many opportunities from OpportunityScorecardAutomation.score_batch()
+
+    Holds one int8 array per dimension, the int16 totals and the decision
+    codes. Insights, recommendations and next steps are only worked out by
+    score(i) for the rows that actually get reported.
+    """
+
+    def __init__(self, scorer: 'OpportunityScorecardAutomation', frame: 'pd.DataFrame', source: Optional[List[Dict]],
+                 dimensions: Dict[str, 'np.ndarray'], total: 'np.ndarray', decision_codes: 'np.ndarray'):
+        self.scorer = scorer
+        self.frame = frame
+        self.source = source
+        self.dimensions = dimensions
+        self.total = total
+        self.decision_codes = decision_codes
+
+    def __len__(self) -> int:
+        return len(self.total)
+
+    @property
+    def names(self) -> 'np.ndarray':
+        if 'name' not in self.frame:
+            return np.full(len(self), 'Unnamed Opportunity', dtype=object)
+        return self.frame['name'].fillna('Unnamed Opportunity').to_numpy(dtype=object)
+
+    @property
+    def decisions(self) -> 'pd.Categorical':
+        return pd.Categorical.from_codes(self.decision_codes, self.scorer.DECISIONS)
+
+    def to_frame(self) -> 'pd.DataFrame':
+        """Name, dimension scores, total and decision of every opportunity"""
+        return pd.DataFrame({'opportunity_name': self.names, **self.dimensions,
+                             'total_score': self.total, 'decision': self.decisions}, index=self.frame.index)
+
+    def top(self, k: int, decision: Optional[str] = None) -> 'np.ndarray':
+        """Row numbers of the k highest totals (optionally of one decision), best first"""
+        rows = np.arange(len(self))
+        if decision is not None:
+            rows = rows[self.decision_codes == self.scorer.DECISIONS.index(decision)]
+        return rows[np.argsort(-self.total[rows], kind='stable')[:k]]
+
+    def opportunity(self, row: int) -> Dict:
+        """The nested opportunity dict of one row"""
+        if self.source is not None:
+            return self.source[row]
+        data = {}
+        for column, value in self.frame.iloc[row].items():
+            if not isinstance(value, (list, dict)) and pd.isna(value):
+                continue  # missing cells stand for missing keys
+            value = value.item() if isinstance(value, np.generic) else value
+            section, _, field = column.partition('.')
+            if field:
+                data.setdefault(section, {})[field] = value
+            else:
+                data[column] = value
+        return data
+
+    def score(self, row: int) -> OpportunityScore:
+        """Full OpportunityScore, with insights and next steps, of one row"""
+        return self.scorer.calculate_comprehensive_score(self.opportunity(row))
+
+
+class StringTable:
+    """Interned strings: each distinct string is stored once and referred to by index"""
+
+    __slots__ = ('strings', '_index')
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def index(self, string: str) -> int:
+        position = self._index.get(string)
+        if position is None:
+            position = self._index[string] = len(self.strings)
+            self.strings.append(string)
+        return position
+
+    def __getitem__(self, position: int) -> str:
+        return self.strings[position]
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class PortfolioScore:
+    """Read-only OpportunityScore look-alike for one row of a ScorePortfolio"""
+
+    __slots__ = ('portfolio', 'row')
+
+    def __init__(self, portfolio: 'ScorePortfolio', row: int):
+        self.portfolio = portfolio
+        self.row = row
+
+    def __getattr__(self, name: str):
+        if name in self.portfolio.FIELDS:
+            return self.portfolio.value(self.row, name)
+        raise AttributeError(name)
+
+    def to_dict(self) -> Dict:
+        """The asdict(OpportunityScore) shape of this row"""
+        return self.portfolio.to_dict(self.row)
+
+
+class ScorePortfolio:
+    """
+    Memory-compact store of many scored opportunities.
+
+    Each opportunity is one row of a NumPy structured array: int8
+    dimension scores, total and decision code, a datetime64 scored_at, and
+    indices into shared tables. Recommendation, risk and next-step strings
+    are interned, because most of them repeat across a portfolio. Each
+    row's risks and next steps are an (offset, count) range into one flat
+    int32 array of string indices. Rows read back as PortfolioScore views
+    or as the asdict(OpportunityScore) shape, and columns() hands out the
+    dimension arrays without copying.
+    """
+
+    DIMENSIONS = ('problem_severity', 'market_size', 'competition_level', 'differentiation',
+                  'technical_feasibility', 'personal_fit')
+    DTYPE = None if np is None else np.dtype(
+        [(dimension, np.int8) for dimension in DIMENSIONS] + [
+            ('total_score', np.int16), ('max_score', np.int16), ('decision', np.int8),
+            ('recommendation', np.int32), ('scored_at', 'datetime64[us]'),
+            ('risks_offset', np.int32), ('risks_count', np.int16),
+            ('next_steps_offset', np.int32), ('next_steps_count', np.int16),
+        ])
+    FIELDS = tuple(OpportunityScore.__dataclass_fields__)
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise RuntimeError("ScorePortfolio requires: pip install numpy")
+        self.names: List[str] = []
+        self.strings = StringTable()
+        self.decisions = StringTable()
+        self._rows = np.zeros(capacity, dtype=self.DTYPE)
+        self._refs = np.zeros(capacity * 16, dtype=np.int32)
+        self._size = 0
+        self._refs_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, row: int) -> PortfolioScore:
+        if not -self._size <= row < self._size:
+            raise IndexError(row)
+        return PortfolioScore(self, row % self._size)
+
+    def __iter__(self):
+        return (PortfolioScore(self, row) for row in range(self._size))
+
+    @property
+    def rows(self) -> 'np.ndarray':
+        """The structured array of all rows (a view)"""
+        return self._rows[:self._size]
+
+    def columns(self) -> Dict[str, 'np.ndarray']:
+        """Dimension scores and totals as zero-copy views into the rows"""
+        rows = self.rows
+        return {name: rows[name] for name in self.DIMENSIONS + ('total_score',)}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the arrays (excluding the shared string tables and names)"""
+        return self.rows.nbytes + self._refs[:self._refs_size].nbytes
+
+    def _reserve(self, rows: int, refs: int):
+        if self._size + rows > len(self._rows):
+            grown = np.zeros(max(2 * len(self._rows), self._size + rows), dtype=self.DTYPE)
+            grown[:self._size] = self._rows[:self._size]
+            self._rows = grown
+        if self._refs_size + refs > len(self._refs):
+            grown = np.zeros(max(2 * len(self._refs), self._refs_size + refs), dtype=np.int32)
+            grown[:self._refs_size] = self._refs[:self._refs_size]
+            self._refs = grown
+
+    def _intern(self, strings: List[str]) -> tuple[int, int]:
+        offset = self._refs_size
+        self._refs[offset:offset + len(strings)] = [self.strings.index(string) for string in strings]
+        self._refs_size += len(strings)
+        return offset, len(strings)
+
+    def append(self, score: OpportunityScore):
+        """Add one OpportunityScore"""
+        self._reserve(1, len(score.risks) + len(score.next_steps))
+        row = self._rows[self._size]
+        for dimension in self.DIMENSIONS:
+            row[dimension] = getattr(score, dimension)
+        row['total_score'] = score.total_score
+        row['max_score'] = score.max_score
+        row['decision'] = self.decisions.index(score.decision)
+        row['recommendation'] = self.strings.index(score.recommendation)
+        row['scored_at'] = np.datetime64(score.scored_at, 'us')
+        row['risks_offset'], row['risks_count'] = self._intern(score.risks)
+        row['next_steps_offset'], row['next_steps_count'] = self._intern(score.next_steps)
+        self.names.append(score.opportunity_name)
+        self._size += 1
+
+    def extend(self, scores):
+        for score in scores:
+            self.append(score)
+
+    def add_batch(self, batch: 'ScoredBatch', insights: bool = True):
+        """
+        Add every row of a ScoredBatch
+
+        Scores, totals and decisions are copied column-wise, and all rows
+        share one scored_at. Insights and next steps cost a per-row scoring
+        pass, so insights=False leaves them empty.
+        """
+        scorer = batch.scorer
+        count = len(batch)
+        first = self._size
+        self._reserve(count, 0)
+        rows = self._rows[first:first + count]
+        for dimension in self.DIMENSIONS:
+            rows[dimension] = batch.dimensions[dimension]
+        rows['total_score'] = batch.total
+        rows['max_score'] = 100
+        rows['decision'] = np.array([self.decisions.index(d) for d in scorer.DECISIONS], dtype=np.int8)[
+            batch.decision_codes]
+        recommendations = [self.strings.index(scorer.DECISION(total)[1]) for total in range(101)]
+        rows['recommendation'] = np.array(recommendations, dtype=np.int32)[batch.total]
+        rows['scored_at'] = np.datetime64(datetime.now(), 'us')
+        self.names.extend(batch.names.tolist())
+        self._size += count
+        if insights:
+            for row in range(count):
+                score = batch.score(row)
+                self._reserve(0, len(score.risks) + len(score.next_steps))
+                target = self._rows[first + row]
+                target['risks_offset'], target['risks_count'] = self._intern(score.risks)
+                target['next_steps_offset'], target['next_steps_count'] = self._intern(score.next_steps)
+
+    def _strings(self, offset: int, count: int) -> List[str]:
+        strings = self.strings.strings
+        return [strings[position] for position in self._refs[offset:offset + count].tolist()]
+
+    def value(self, row: int, name: str):
+        """One field of one row, as OpportunityScore holds it"""
+        record = self._rows[row]
+        if name == 'opportunity_name':
+            return self.names[row]
+        if name == 'decision':
+            return self.decisions[record['decision']]
+        if name == 'recommendation':
+            return self.strings[record['recommendation']]
+        if name == 'scored_at':
+            return record['scored_at'].item().isoformat()
+        if name in ('risks', 'next_steps'):
+            return self._strings(record[f'{name}_offset'], record[f'{name}_count'])
+        return int(record[name])
+
+    def to_dict(self, row: int) -> Dict:
+        """The asdict(OpportunityScore) shape of one row"""
+        return {name: self.value(row, name) for name in self.FIELDS}
+
+    def to_score(self, row: int) -> OpportunityScore:
+        return OpportunityScore(**self.to_dict(row))
+
+    def export_jsonl(self, path: str) -> str:
+        """Write every row as one JSON line in the export_scorecard shape"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for row in range(self._size):
+                f.write(json.dumps(self.to_dict(row), ensure_ascii=False) + '\n')
+        return path
+
+
+class ScoreIndex:
+    """
+    Persistent index over scorecards for threshold and top-k queries.
+
+    Every score added becomes a row of a SQLite table, so the history of
+    each opportunity is kept; export_scorecard() adds each scorecard it
+    writes. The latest score of every opportunity is indexed in memory:
+    an int16 column per dimension and total, the order of opportunities
+    sorted by each column, a bitmap per decision, and the score before
+    the latest. close() saves these arrays in the same file, and the next
+    process loads them instead of scanning the table; only rows added
+    after the snapshot are read and merged, with one vectorized pass per
+    column. Without a snapshot the first query builds them in one pass.
+    add() buffers its row and writes FLUSH_EVERY rows per transaction.
+    Result dicts are read by row id when first returned. query()
+    binary-searches every range in its sorted column, starts from the
+    narrowest range and checks the other conditions only on those
+    opportunities. Top-k filtered by decision at most walks a sorted
+    column down from the top. `improved` compares with
+    the previous score in memory, and only goes to SQLite for the
+    opportunities scored more than once since its baseline.
+    """
+
+    COLUMNS = ScorePortfolio.DIMENSIONS + ('total_score',)
+    SCHEMA = f"""
+        CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            opportunity_name TEXT NOT NULL,
+            path TEXT,
+            scored_at TEXT NOT NULL,
+            decision TEXT NOT NULL,
+            {', '.join(f'{column} INTEGER NOT NULL' for column in COLUMNS)}
+        );
+        CREATE INDEX IF NOT EXISTS scores_by_name ON scores (opportunity_name, scored_at);
+        CREATE INDEX IF NOT EXISTS scores_by_time ON scores (scored_at);
+        CREATE TABLE IF NOT EXISTS index_snapshot (
+            last_id INTEGER NOT NULL,
+            names TEXT NOT NULL,
+            decisions TEXT NOT NULL,
+            arrays BLOB NOT NULL
+        );
+    """
+    INSERT = (f"INSERT INTO scores (opportunity_name, path, scored_at, decision, {', '.join(COLUMNS)}) "
+              f"VALUES ({', '.join('?' * (4 + len(COLUMNS)))})")
+    SELECT = f"SELECT id, opportunity_name, path, scored_at, decision, {', '.join(COLUMNS)} FROM scores"
+    # Opportunities examined per step when walking a sorted column
+    BLOCK = 1024
+    # Rows buffered by add() per transaction
+    FLUSH_EVERY = 1000
+
+    def __init__(self, path: str = "output/score_index.db"):
+        if np is None:
+            raise RuntimeError("ScoreIndex requires: pip install numpy")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(self.SCHEMA)
+        self._loaded = False
+        self._unwritten = []
+        # Highest scores.id in the in-memory index, and whether it changed since the snapshot
+        self._last_id = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        """Number of opportunities indexed"""
+        if self._loaded:
+            self._sync()
+            return len(self.names)
+        self.flush()
+        return self._conn.execute("SELECT COUNT(DISTINCT opportunity_name) FROM scores").fetchone()[0]
+
+    @classmethod
+    def _row(cls, score, path: Optional[str]) -> tuple:
+        """Table row of an OpportunityScore, PortfolioScore or export_scorecard dict"""
+        value = score.get if isinstance(score, dict) else lambda name: getattr(score, name)
+        return (value('opportunity_name'), path, value('scored_at'), value('decision'),
+                *(int(value(column)) for column in cls.COLUMNS))
+
+    def add(self, score, path: Optional[str] = None):
+        """Index one score, newer than every score indexed before it"""
+        self._unwritten.append(self._row(score, path))
+        if len(self._unwritten) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def add_many(self, scores, paths: Optional[List[str]] = None) -> int:
+        """Index many scores, oldest first, in one transaction"""
+        self.flush()
+        rows = [self._row(score, path) for score, path in zip(scores, paths or itertools.repeat(None))]
+        with self._conn:
+            self._conn.executemany(self.INSERT, rows)
+        return len(rows)
+
+    def flush(self):
+        """Write the rows buffered by add()"""
+        if self._unwritten:
+            with self._conn:
+                self._conn.executemany(self.INSERT, self._unwritten)
+            self._unwritten = []
+
+    def add_exports(self, source: str) -> int:
+        """
+        Index earlier results: a directory of export_scorecard JSON files or a --input results JSONL
+
+        Scores already indexed (same opportunity and scored_at) are skipped.
+        """
+        self.flush()
+        records, paths = [], []
+        for item, text in ScorecardRunner.iter_inputs(source):
+            record = json.loads(text if text is not None else Path(item).read_text(encoding='utf-8'))
+            if 'total_score' not in record or record.get('error'):
+                continue
+            if not self._conn.execute("SELECT 1 FROM scores WHERE opportunity_name = ? AND scored_at = ?",
+                                      (record['opportunity_name'], record['scored_at'])).fetchone():
+                records.append(record)
+                paths.append(item if text is None else None)
+        order = sorted(range(len(records)), key=lambda i: records[i]['scored_at'])
+        return self.add_many([records[i] for i in order], [paths[i] for i in order])
+
+    @classmethod
+    def _record(cls, row: tuple) -> Dict:
+        """Query result of a table row (without its id)"""
+        name, path, scored_at, decision, *values = row
+        return {'opportunity_name': name, **dict(zip(cls.COLUMNS, values)),
+                'decision': decision, 'scored_at': scored_at, 'path': path}
+
+    @staticmethod
+    def _timestamp(scored_at) -> float:
+        """Seconds since the epoch of a datetime or ISO string, for vectorized comparisons"""
+        if not isinstance(scored_at, datetime):
+            scored_at = datetime.fromisoformat(scored_at)
+        return scored_at.timestamp()
+
+    def _sync(self):
+        """Bring the in-memory index up to date with the table"""
+        self.flush()
+        if not self._loaded and not self._restore():
+            self._load()
+        rows = self._conn.execute(f"{self.SELECT} WHERE id > ? ORDER BY id", (self._last_id,)).fetchall()
+        if rows:
+            self._merge(rows)
+
+    def _load(self):
+        """Build the in-memory index from the latest two scores of every opportunity"""
+        rows = self._conn.execute(f"""
+            SELECT id, opportunity_name, path, scored_at, decision, {', '.join(self.COLUMNS)}, rank FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY opportunity_name ORDER BY id DESC) AS rank,
+                       MIN(id) OVER (PARTITION BY opportunity_name) AS first
+                FROM scores)
+            WHERE rank <= 2 ORDER BY first, rank
+        """).fetchall()
+        # Opportunities are numbered in the order they were first indexed
+        latest = [row for row in rows if row[-1] == 1]
+        self.names = [row[1] for row in latest]
+        self._slots = {name: slot for slot, name in enumerate(self.names)}
+        self._ids = np.array([row[0] for row in latest], dtype=np.int64)
+        self._records = {slot: self._record(row[1:-1]) for slot, row in enumerate(latest)}
+        self._latest_at = np.array([self._timestamp(row[3]) for row in latest], dtype=float)
+        values = np.array([row[5:-1] for row in latest], dtype=np.int16).reshape(len(latest), len(self.COLUMNS))
+        # The score before the latest: -inf and -1 where there is none
+        self._previous_at = np.full(len(latest), -np.inf)
+        previous = np.full_like(values, -1)
+        for row in rows:
+            if row[-1] == 2:
+                slot = self._slots[row[1]]
+                self._previous_at[slot] = self._timestamp(row[3])
+                previous[slot] = row[5:-1]
+        slots = np.arange(len(latest), dtype=np.int32)
+        self._values = {}
+        self._previous = {}
+        self._order = {}
+        self._keys = {}
+        for i, column in enumerate(self.COLUMNS):
+            # Ascending values, and later opportunities first within a value,
+            # so walking down from the top lets earlier opportunities win ties
+            self._values[column] = values[:, i].copy()
+            self._previous[column] = previous[:, i].copy()
+            self._order[column] = np.lexsort((-slots, self._values[column])).astype(np.int32)
+            self._keys[column] = self._values[column][self._order[column]]
+        decisions = np.array([row[4] for row in latest], dtype=object)
+        self._bitmaps = {decision: decisions == decision for decision in set(decisions.tolist())}
+        self._last_id = int(self._ids.max()) if len(latest) else 0
+        self._loaded = True
+        self._dirty = True
+
+    def _restore(self) -> bool:
+        """Load the arrays saved by the last close(), if they still describe this table"""
+        snapshot = self._conn.execute("SELECT last_id, names, decisions, arrays FROM index_snapshot").fetchone()
+        if snapshot is None:
+            return False
+        last_id, names, decisions, blob = snapshot
+        # The table is append-only; a snapshot past its end belongs to another table
+        if last_id > self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM scores").fetchone()[0]:
+            return False
+        with np.load(io.BytesIO(blob)) as arrays:
+            arrays = dict(arrays)
+        self.names = json.loads(names)
+        self._slots = {name: slot for slot, name in enumerate(self.names)}
+        self._ids = arrays['ids']
+        self._records = {}
+        self._latest_at = arrays['latest_at']
+        self._previous_at = arrays['previous_at']
+        self._values = {column: arrays[f'values_{column}'] for column in self.COLUMNS}
+        self._previous = {column: arrays[f'previous_{column}'] for column in self.COLUMNS}
+        self._order = {column: arrays[f'order_{column}'] for column in self.COLUMNS}
+        self._keys = {column: arrays[f'keys_{column}'] for column in self.COLUMNS}
+        self._bitmaps = {decision: np.unpackbits(arrays[f'bitmap_{i}'], count=len(self.names)).astype(bool)
+                         for i, decision in enumerate(json.loads(decisions))}
+        self._last_id = last_id
+        self._loaded = True
+        self._dirty = False
+        return True
+
+    def _save(self):
+        """Persist the in-memory index so the next process can skip the table scan"""
+        if not self._loaded or not self._dirty:
+            return
+        decisions = list(self._bitmaps)
+        arrays = {'ids': self._ids, 'latest_at': self._latest_at, 'previous_at': self._previous_at}
+        for column in self.COLUMNS:
+            arrays[f'values_{column}'] = self._values[column]
+            arrays[f'previous_{column}'] = self._previous[column]
+            arrays[f'order_{column}'] = self._order[column]
+            arrays[f'keys_{column}'] = self._keys[column]
+        for i, decision in enumerate(decisions):
+            arrays[f'bitmap_{i}'] = np.packbits(self._bitmaps[decision])
+        blob = io.BytesIO()
+        np.savez(blob, **arrays)
+        with self._conn:
+            self._conn.execute("DELETE FROM index_snapshot")
+            self._conn.execute("INSERT INTO index_snapshot (last_id, names, decisions, arrays) VALUES (?, ?, ?, ?)",
+                               (self._last_id, json.dumps(self.names, ensure_ascii=False),
+                                json.dumps(decisions, ensure_ascii=False), blob.getvalue()))
+        self._dirty = False
+
+    @staticmethod
+    def _sort_keys(values: 'np.ndarray', slots: 'np.ndarray') -> 'np.ndarray':
+        """One int64 per entry that sorts like a column: ascending value, then descending slot"""
+        return (values.astype(np.int64) << 32) - slots
+
+    def _merge(self, rows: List[tuple]):
+        """Fold table rows newer than the in-memory index into it, oldest first"""
+        count = len(self.names)
+        latest, latest_at, previous, previous_at, decided, ids = {}, {}, {}, {}, {}, {}
+        for row in rows:
+            row_id, name, path, scored_at, decision, *values = row
+            slot = self._slots.get(name)
+            if slot is None:
+                slot = self._slots[name] = len(self.names)
+                self.names.append(name)
+            elif slot in latest:
+                previous[slot], previous_at[slot] = latest[slot], latest_at[slot]
+            else:
+                previous[slot] = [int(self._values[column][slot]) for column in self.COLUMNS]
+                previous_at[slot] = self._latest_at[slot]
+            latest[slot], latest_at[slot] = values, self._timestamp(scored_at)
+            decided[slot], ids[slot] = decision, row_id
+            self._records[slot] = self._record(row[1:])
+        self._last_id = rows[-1][0]
+        self._dirty = True
+
+        grow = len(self.names) - count
+        self._ids = np.concatenate((self._ids, np.zeros(grow, dtype=np.int64)))
+        self._ids[list(ids)] = list(ids.values())
+        self._latest_at = np.concatenate((self._latest_at, np.full(grow, -np.inf)))
+        self._latest_at[list(latest_at)] = list(latest_at.values())
+        self._previous_at = np.concatenate((self._previous_at, np.full(grow, -np.inf)))
+        self._previous_at[list(previous_at)] = list(previous_at.values())
+        slots = np.fromiter(latest, dtype=np.int32, count=len(latest))
+        values = np.array(list(latest.values()), dtype=np.int16).reshape(len(slots), len(self.COLUMNS))
+        moved = np.fromiter(previous, dtype=np.int32, count=len(previous))
+        before = np.array(list(previous.values()), dtype=np.int16).reshape(len(moved), len(self.COLUMNS))
+        changed = np.zeros(len(self.names), dtype=bool)
+        changed[slots] = True
+        ranked = slots[np.argsort(-slots)]
+        for i, column in enumerate(self.COLUMNS):
+            self._values[column] = np.concatenate((self._values[column], np.zeros(grow, dtype=np.int16)))
+            self._values[column][slots] = values[:, i]
+            self._previous[column] = np.concatenate((self._previous[column], np.full(grow, -1, dtype=np.int16)))
+            self._previous[column][moved] = before[:, i]
+            # Take the merged opportunities out of the sorted column and put
+            # them back, sorted among themselves, with one searchsorted
+            keep = ~changed[self._order[column]]
+            order, keys = self._order[column][keep], self._keys[column][keep]
+            added = ranked[np.argsort(self._values[column][ranked], kind='stable')]
+            positions = np.searchsorted(self._sort_keys(keys, order),
+                                        self._sort_keys(self._values[column][added], added))
+            self._order[column] = np.insert(order, positions, added)
+            self._keys[column] = np.insert(keys, positions, self._values[column][added])
+
+        decisions = np.array(list(decided.values()), dtype=object)
+        for decision in set(decisions.tolist()) - set(self._bitmaps):
+            self._bitmaps[decision] = np.zeros(count, dtype=bool)
+        for decision, bitmap in self._bitmaps.items():
+            bitmap = self._bitmaps[decision] = np.concatenate((bitmap, np.zeros(grow, dtype=bool)))
+            bitmap[slots] = decisions == decision
+
+    def _in_decisions(self, decisions: List[str], slots: 'np.ndarray') -> 'np.ndarray':
+        mask = np.zeros(len(slots), dtype=bool)
+        for decision in decisions:
+            mask |= self._bitmaps[decision][slots]
+        return mask
+
+    def _improved(self, column: str, since, slots: 'np.ndarray') -> 'np.ndarray':
+        """The opportunities in `slots` whose `column` is higher than in their last score before `since`"""
+        since = since or datetime.now() - timedelta(days=7)
+        since = since.isoformat() if isinstance(since, datetime) else since
+        since_at = self._timestamp(since)
+        # Only opportunities re-scored since then can have improved. Usually
+        # the previous score is the baseline; opportunities scored again since
+        # then have an older baseline, looked up in one statement
+        recent = slots[self._latest_at[slots] >= since_at]
+        scored_again = self._previous_at[recent] >= since_at
+        older = recent[scored_again].tolist()
+        baseline = self._previous[column][recent]
+        if older:
+            before = self._conn.execute(f"""
+                SELECT (SELECT {column} FROM scores WHERE opportunity_name = candidates.value AND scored_at < ?
+                        ORDER BY scored_at DESC LIMIT 1)
+                FROM json_each(?) AS candidates ORDER BY candidates.key
+            """, (since, json.dumps([self.names[slot] for slot in older]))).fetchall()
+            baseline[scored_again] = [-1 if value is None else value for value, in before]
+        return recent[(baseline >= 0) & (self._values[column][recent] > baseline)]
+
+    def _walk(self, order_by: str, decisions: Optional[List[str]], k: Optional[int]) -> 'np.ndarray':
+        """Best `order_by` first, in blocks, until k opportunities of `decisions` are found"""
+        order = self._order[order_by]
+        if decisions is None:
+            return order[::-1][:k]
+        found, count = [], 0
+        for end in range(len(order), 0, -self.BLOCK):
+            block = order[max(0, end - self.BLOCK):end][::-1]
+            block = block[self._in_decisions(decisions, block)]
+            found.append(block)
+            count += len(block)
+            if k is not None and count >= k:
+                break
+        return np.concatenate(found)[:k] if found else order[:0]
+
+    def query(self, decision: Optional[str] = None, k: Optional[int] = None, order_by: str = 'total_score',
+              improved: Optional[str] = None, since=None, **ranges) -> List[Dict]:
+        """
+        Latest scores matching every condition, best `order_by` first (earlier opportunities win ties)
+
+        `ranges` map columns to a minimum or a (minimum, maximum) pair, with
+        None for an open end, e.g. technical_feasibility=11. `decision`
+        matches every decision containing it, e.g. 'MAYBE'. `improved` keeps
+        opportunities whose score in that column rose since their last score
+        before `since` (a datetime or ISO string, default a week ago).
+        """
+        for column in (order_by, improved, *ranges):
+            if column is not None and column not in self.COLUMNS:
+                raise ValueError(f"Unknown column: {column}")
+        self._sync()
+
+        decisions = [name for name in self._bitmaps if decision in name] if decision else None
+        spans = []
+        for column, bounds in ranges.items():
+            low, high = bounds if isinstance(bounds, tuple) else (bounds, None)
+            keys = self._keys[column]
+            start = 0 if low is None else int(np.searchsorted(keys, low, 'left'))
+            stop = len(keys) if high is None else int(np.searchsorted(keys, high, 'right'))
+            spans.append((max(0, stop - start), column, low, high, start, stop))
+        spans.sort(key=lambda span: span[0])
+
+        if spans:
+            _, column, _, _, start, stop = spans.pop(0)
+            slots = self._order[column][start:stop]
+        elif improved is not None:
+            # Narrowed down by the decision bitmaps below
+            slots = np.arange(len(self.names), dtype=np.int32)
+        else:
+            return self._results(self._walk(order_by, decisions, k))
+
+        keep = np.ones(len(slots), dtype=bool)
+        for _, column, low, high, _, _ in spans:
+            values = self._values[column][slots]
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+        if decisions is not None:
+            keep &= self._in_decisions(decisions, slots)
+        slots = slots[keep]
+        if improved is not None:
+            slots = self._improved(improved, since, slots)
+        ranked = slots[np.lexsort((slots, -self._values[order_by][slots].astype(np.int32)))]
+        return self._results(ranked[:k])
+
+    def _results(self, slots: 'np.ndarray') -> List[Dict]:
+        slots = slots.tolist()
+        missing = [slot for slot in slots if slot not in self._records]
+        if missing:
+            by_id = {int(self._ids[slot]): slot for slot in missing}
+            for row in self._conn.execute(f"{self.SELECT} WHERE id IN (SELECT value FROM json_each(?))",
+                                          (json.dumps(list(by_id)),)):
+                self._records[by_id[row[0]]] = self._record(row[1:])
+        return [self._records[slot].copy() for slot in slots]
+
+    def close(self):
+        """Write buffered rows and save the in-memory index for the next process"""
+        self.flush()
+        self._save()
+        self._conn.close()
+
+
 class OpportunityScorecardAutomation:
     """Automates the Hermetic opportunity scoring process"""
 
@@ -46,278 +810,260 @@ class OpportunityScorecardAutomation:
     DECISION_THRESHOLD_BUILD = 70
     DECISION_THRESHOLD_MAYBE = 50
 
-    def __init__(self):
+    # Problem severity (max 20)
+    PAIN_SEVERITY = InsightLadder([
+        ('>=', 8, 8, "High pain severity ({value}/10)"),
+        ('>=', 6, 6, "Moderate pain severity ({value}/10)"),
+        ('>=', 4, 4, "Low-moderate pain severity ({value}/10)"),
+    ], (2, "Low pain severity ({value}/10)"))
+    PAIN_FREQUENCY = ScoreTable({
+        ('daily', 'constant', 'continuous'): (6, "Problem occurs daily/constantly"),
+        ('weekly', 'frequent'): (4, "Problem occurs weekly/frequently"),
+        ('monthly', 'occasional'): (2, "Problem occurs monthly/occasionally"),
+    })
+    PEOPLE_AFFECTED = InsightLadder([
+        ('>=', 100000, 6, "Large audience affected ({value:,})"),
+        ('>=', 10000, 4, "Medium audience affected ({value:,})"),
+        ('>=', 1000, 2, "Small audience affected ({value:,})"),
+    ])
+
+    # Market size (max 20)
+    TAM = InsightLadder([
+        ('>=', 100, 10, "Large TAM (${value}M+)"),
+        ('>=', 10, 7, "Medium TAM (${value}M)"),
+        ('>=', 1, 4, "Small TAM (${value}M)"),
+    ])
+    SEARCH_VOLUME = InsightLadder([
+        ('>=', 50000, 6, "High search volume ({value:,}/mo)"),
+        ('>=', 10000, 4, "Medium search volume ({value:,}/mo)"),
+        ('>=', 1000, 2, "Low search volume ({value:,}/mo)"),
+    ])
+    GROWTH_RATE = InsightLadder([
+        ('>=', 50, 4, "High growth ({value}%)"),
+        ('>=', 20, 3, "Good growth ({value}%)"),
+        ('>=', 0, 1, "Stable/slow growth ({value}%)"),
+    ])
+
+    # Competition (max 15, inverse scoring)
+    COMPETITORS = InsightLadder([
+        # No competition might mean no market
+        ('==', 0, 2, "No direct competitors (validate market exists)"),
+        ('<=', 3, 6, "Low competition ({value} competitors)"),
+        ('<=', 10, 4, "Moderate competition ({value} competitors)"),
+    ], (2, "High competition ({value}+ competitors)"))
+    SOLUTION_QUALITY = InsightLadder([
+        ('<=', 5, 5, "Poor existing solutions (avg quality: {value}/10)"),
+        ('<=', 7, 3, "Moderate existing solutions (avg quality: {value}/10)"),
+    ], (1, "High-quality existing solutions (avg quality: {value}/10)"))
+    SATURATION = ScoreTable({
+        'low': (4, "Low market saturation - room to grow"),
+        'medium': (2, "Medium saturation - need differentiation"),
+    }, (1, "High saturation - difficult to enter"))
+
+    # Differentiation (max 15)
+    NO_UNIQUE_ANGLE = (0, "No clear differentiation - high risk")
+    ANGLE_STRENGTH = ScoreTable({
+        'strong': (7, "Strong unique value proposition"),
+        'moderate': (5, "Moderate differentiation angle"),
+    }, (3, "Weak differentiation angle"))
+    TECH_ADVANTAGE = ScoreTable({True: (5, "Technology/innovation advantage exists")})
+    POSITIONING = ScoreTable({
+        'clear': (3, "Clear market positioning"),
+        'moderate': (2, "Moderate positioning clarity"),
+    })
+
+    # Technical feasibility (max 15)
+    COMPLEXITY = ScoreTable({
+        'low': (7, "Low technical complexity - quick to build"),
+        'medium': (4, "Medium complexity - reasonable timeline"),
+    }, (1, "High complexity - long development time"))
+    TIME_TO_MVP = InsightLadder([
+        ('<=', 2, 5, "Quick MVP possible ({value} sprints)"),
+        ('<=', 4, 3, "Moderate MVP timeline ({value} sprints)"),
+    ], (1, "Long MVP timeline ({value}+ sprints)"))
+    TECH_AVAILABLE = ScoreTable({True: (3, "Required technology/APIs available")},
+                                (0, "Missing required technology - needs R&D"))
+
+    # Personal fit (max 15)
+    DOMAIN_UNDERSTANDING = ScoreTable({
+        'high': (7, "Strong domain expertise"),
+        'medium': (4, "Moderate domain knowledge"),
+    }, (1, "Limited domain expertise"))
+    PASSION = ScoreTable({
+        'high': (5, "High passion for this problem space"),
+        'medium': (3, "Moderate interest in problem space"),
+    }, (1, "Low interest - may affect sustainability"))
+    SUSTAINABLE_MOTIVATION = ScoreTable({True: (3, "Long-term motivation sustainable")},
+                                        (0, "Motivation sustainability unclear"))
+
+    DECISION = InsightLadder([
+        ('>=', DECISION_THRESHOLD_BUILD, "BUILD IT",
+         "✅ Strong opportunity (score: {value}/100). Proceed to build phase."),
+        ('>=', DECISION_THRESHOLD_MAYBE, "MAYBE - INVESTIGATE",
+         "⚠️  Moderate opportunity (score: {value}/100). Needs deeper validation before committing."),
+    ], ("PASS - PIVOT", "❌ Weak opportunity (score: {value}/100). Consider pivoting or finding new idea."))
+
+    DECISIONS = ["BUILD IT", "MAYBE - INVESTIGATE", "PASS - PIVOT"]
+
+    # Every dimension's (input section, max points, inputs). An input is
+    # (field, default, ladder, kind[, gate]): kind 'number' feeds the value
+    # to the ladder as is, 'text' lowercased and 'flag' as a bool. A gated
+    # input scores `fallback` unless its (field, default) gate is truthy.
+    DIMENSIONS = {
+        'problem_severity': ('problem', 20, (
+            ('severity_score', 0, PAIN_SEVERITY, 'number'),  # Assumed 1-10 scale
+            ('frequency', 'unknown', PAIN_FREQUENCY, 'text'),
+            ('people_affected', 0, PEOPLE_AFFECTED, 'number'),
+        )),
+        'market_size': ('market', 20, (
+            ('tam_millions', 0, TAM, 'number'),
+            ('monthly_searches', 0, SEARCH_VOLUME, 'number'),
+            ('growth_rate_percent', 0, GROWTH_RATE, 'number'),
+        )),
+        'competition_level': ('competition', 15, (
+            ('num_competitors', 0, COMPETITORS, 'number'),
+            ('avg_quality_score', 5, SOLUTION_QUALITY, 'number'),  # 1-10 scale
+            ('saturation_level', 'medium', SATURATION, 'text'),
+        )),
+        'differentiation': ('differentiation', 15, (
+            ('angle_strength', 'weak', ANGLE_STRENGTH, 'text', ('has_unique_angle', False, NO_UNIQUE_ANGLE)),
+            ('tech_advantage', False, TECH_ADVANTAGE, 'flag'),
+            ('positioning_clarity', 'unclear', POSITIONING, 'text'),
+        )),
+        'technical_feasibility': ('technical', 15, (
+            ('complexity', 'medium', COMPLEXITY, 'text'),
+            ('estimated_sprint_count', 999, TIME_TO_MVP, 'number'),
+            ('required_tech_available', False, TECH_AVAILABLE, 'flag'),
+        )),
+        'personal_fit': ('personal_fit', 15, (
+            ('domain_understanding', 'low', DOMAIN_UNDERSTANDING, 'text'),
+            ('passion_level', 'medium', PASSION, 'text'),
+            ('sustainable_motivation', False, SUSTAINABLE_MOTIVATION, 'flag'),
+        )),
+    }
+
+    def __init__(self, index: Optional[ScoreIndex] = None):
         self.scores = []
+        self.index = index
+
+    def score_dimension(self, dimension: str, data: Dict) -> tuple[int, List[str]]:
+        """Score one dimension (see DIMENSIONS) of an opportunity's input section"""
+        _, max_score, inputs = self.DIMENSIONS[dimension]
+        score = 0
+        insights = []
+        for field, default, ladder, kind, *gate in inputs:
+            value = data.get(field, default)
+            if kind == 'text':
+                value = value.lower()
+            elif kind == 'flag':
+                value = bool(value)
+            points, insight = ladder(value)
+            if gate and not data.get(gate[0][0], gate[0][1]):
+                points, insight = gate[0][2]
+            score += points
+            if insight:
+                insights.append(insight)
+        return min(score, max_score), insights
+
+    def score_batch(self, opportunities) -> ScoredBatch:
+        """
+        Score many opportunities at once with vectorized bucketing
+
+        `opportunities` is a list of opportunity dicts, or columnar data (a
+        DataFrame or dict of arrays) with one "section.field" column per
+        input, as pd.json_normalize lays them out. Missing columns and cells
+        take the same defaults as missing keys. Numbers are bucketed with
+        np.searchsorted; text and flags are looked up once per distinct
+        value. Dimension scores, totals and decisions match
+        calculate_comprehensive_score row for row.
+        """
+        if pd is None:
+            raise RuntimeError("Bulk scoring requires: pip install numpy pandas")
+        source = None
+        if isinstance(opportunities, list):
+            source = opportunities
+            frame = pd.json_normalize(opportunities) if opportunities else pd.DataFrame()
+        else:
+            frame = opportunities if isinstance(opportunities, pd.DataFrame) else pd.DataFrame(opportunities)
+        rows = len(frame)
+
+        def column(section: str, field: str, default) -> 'pd.Series':
+            name = f"{section}.{field}"
+            if name not in frame:
+                return pd.Series([default] * rows, index=frame.index, dtype=object if isinstance(default, str) else None)
+            return frame[name].fillna(default)
+
+        def truthy(values: 'pd.Series') -> 'np.ndarray':
+            # Object arrays cast to bool by each value's truthiness
+            return values.to_numpy(dtype=object).astype(bool)
+
+        def lookup(values: 'pd.Series', score) -> 'np.ndarray':
+            codes, uniques = pd.factorize(values)
+            return np.array([score(value) for value in uniques] + [0], dtype=np.int64)[codes]
+
+        dimensions = {}
+        for dimension, (section, max_score, inputs) in self.DIMENSIONS.items():
+            score = np.zeros(rows, dtype=np.int64)
+            for field, default, ladder, kind, *gate in inputs:
+                values = column(section, field, default)
+                if kind == 'number':
+                    points = ladder.score(values.to_numpy(dtype=float))
+                elif kind == 'text':
+                    points = lookup(values, lambda value: ladder(value.lower())[0])
+                else:
+                    points = np.where(truthy(values), ladder(True)[0], ladder(False)[0])
+                if gate:
+                    (gate_field, gate_default, fallback), = gate
+                    points = np.where(truthy(column(section, gate_field, gate_default)), points, fallback[0])
+                score += points
+            dimensions[dimension] = np.minimum(score, max_score).astype(np.int8)
+
+        total = sum(score.astype(np.int16) for score in dimensions.values())
+        region_codes = np.array([self.DECISIONS.index(decision) for decision, _ in self.DECISION.table], dtype=np.int8)
+        decision_codes = region_codes[self.DECISION.regions(total)]
+        return ScoredBatch(self, frame, source, dimensions, total, decision_codes)
 
     def score_problem_severity(self, pain_data: Dict) -> tuple[int, List[str]]:
         """
         Score problem severity (max 20 points)
         Based on: pain intensity, frequency, number affected
         """
-        score = 0
-        insights = []
-
-        # Pain intensity (0-8 points)
-        severity = pain_data.get('severity_score', 0)  # Assumed 1-10 scale
-        if severity >= 8:
-            score += 8
-            insights.append(f"High pain severity ({severity}/10)")
-        elif severity >= 6:
-            score += 6
-            insights.append(f"Moderate pain severity ({severity}/10)")
-        elif severity >= 4:
-            score += 4
-            insights.append(f"Low-moderate pain severity ({severity}/10)")
-        else:
-            score += 2
-            insights.append(f"Low pain severity ({severity}/10)")
-
-        # Frequency (0-6 points)
-        frequency = pain_data.get('frequency', 'unknown').lower()
-        if frequency in ['daily', 'constant', 'continuous']:
-            score += 6
-            insights.append("Problem occurs daily/constantly")
-        elif frequency in ['weekly', 'frequent']:
-            score += 4
-            insights.append("Problem occurs weekly/frequently")
-        elif frequency in ['monthly', 'occasional']:
-            score += 2
-            insights.append("Problem occurs monthly/occasionally")
-
-        # Number affected (0-6 points)
-        people_affected = pain_data.get('people_affected', 0)
-        if people_affected >= 100000:
-            score += 6
-            insights.append(f"Large audience affected ({people_affected:,})")
-        elif people_affected >= 10000:
-            score += 4
-            insights.append(f"Medium audience affected ({people_affected:,})")
-        elif people_affected >= 1000:
-            score += 2
-            insights.append(f"Small audience affected ({people_affected:,})")
-
-        return min(score, 20), insights
+        return self.score_dimension('problem_severity', pain_data)
 
     def score_market_size(self, market_data: Dict) -> tuple[int, List[str]]:
         """
         Score market size (max 20 points)
         Based on: TAM, search volume, growth potential
         """
-        score = 0
-        insights = []
-
-        # TAM - Total Addressable Market (0-10 points)
-        tam = market_data.get('tam_millions', 0)
-        if tam >= 100:
-            score += 10
-            insights.append(f"Large TAM (${tam}M+)")
-        elif tam >= 10:
-            score += 7
-            insights.append(f"Medium TAM (${tam}M)")
-        elif tam >= 1:
-            score += 4
-            insights.append(f"Small TAM (${tam}M)")
-
-        # Search volume (0-6 points)
-        search_volume = market_data.get('monthly_searches', 0)
-        if search_volume >= 50000:
-            score += 6
-            insights.append(f"High search volume ({search_volume:,}/mo)")
-        elif search_volume >= 10000:
-            score += 4
-            insights.append(f"Medium search volume ({search_volume:,}/mo)")
-        elif search_volume >= 1000:
-            score += 2
-            insights.append(f"Low search volume ({search_volume:,}/mo)")
-
-        # Growth rate (0-4 points)
-        growth_rate = market_data.get('growth_rate_percent', 0)
-        if growth_rate >= 50:
-            score += 4
-            insights.append(f"High growth ({growth_rate}%)")
-        elif growth_rate >= 20:
-            score += 3
-            insights.append(f"Good growth ({growth_rate}%)")
-        elif growth_rate >= 0:
-            score += 1
-            insights.append(f"Stable/slow growth ({growth_rate}%)")
-
-        return min(score, 20), insights
+        return self.score_dimension('market_size', market_data)
 
     def score_competition(self, competitor_data: Dict) -> tuple[int, List[str]]:
         """
         Score competition level (max 15 points)
         Based on: number of competitors, quality, saturation
         """
-        score = 0
-        insights = []
-
-        # Number of competitors (0-6 points, inverse scoring)
-        num_competitors = competitor_data.get('num_competitors', 0)
-        if num_competitors == 0:
-            score += 2  # No competition might mean no market
-            insights.append("No direct competitors (validate market exists)")
-        elif num_competitors <= 3:
-            score += 6
-            insights.append(f"Low competition ({num_competitors} competitors)")
-        elif num_competitors <= 10:
-            score += 4
-            insights.append(f"Moderate competition ({num_competitors} competitors)")
-        else:
-            score += 2
-            insights.append(f"High competition ({num_competitors}+ competitors)")
-
-        # Quality of solutions (0-5 points, inverse scoring)
-        solution_quality = competitor_data.get('avg_quality_score', 5)  # 1-10 scale
-        if solution_quality <= 5:
-            score += 5
-            insights.append(f"Poor existing solutions (avg quality: {solution_quality}/10)")
-        elif solution_quality <= 7:
-            score += 3
-            insights.append(f"Moderate existing solutions (avg quality: {solution_quality}/10)")
-        else:
-            score += 1
-            insights.append(f"High-quality existing solutions (avg quality: {solution_quality}/10)")
-
-        # Market saturation (0-4 points, inverse scoring)
-        saturation = competitor_data.get('saturation_level', 'medium').lower()
-        if saturation == 'low':
-            score += 4
-            insights.append("Low market saturation - room to grow")
-        elif saturation == 'medium':
-            score += 2
-            insights.append("Medium saturation - need differentiation")
-        else:
-            score += 1
-            insights.append("High saturation - difficult to enter")
-
-        return min(score, 15), insights
+        return self.score_dimension('competition_level', competitor_data)
 
     def score_differentiation(self, diff_data: Dict) -> tuple[int, List[str]]:
         """
         Score differentiation potential (max 15 points)
         Based on: unique angle, tech advantage, positioning
         """
-        score = 0
-        insights = []
-
-        # Unique angle (0-7 points)
-        has_unique_angle = diff_data.get('has_unique_angle', False)
-        angle_strength = diff_data.get('angle_strength', 'weak').lower()
-
-        if has_unique_angle:
-            if angle_strength == 'strong':
-                score += 7
-                insights.append("Strong unique value proposition")
-            elif angle_strength == 'moderate':
-                score += 5
-                insights.append("Moderate differentiation angle")
-            else:
-                score += 3
-                insights.append("Weak differentiation angle")
-        else:
-            insights.append("No clear differentiation - high risk")
-
-        # Technology advantage (0-5 points)
-        tech_advantage = diff_data.get('tech_advantage', False)
-        if tech_advantage:
-            score += 5
-            insights.append("Technology/innovation advantage exists")
-
-        # Market positioning (0-3 points)
-        positioning = diff_data.get('positioning_clarity', 'unclear').lower()
-        if positioning == 'clear':
-            score += 3
-            insights.append("Clear market positioning")
-        elif positioning == 'moderate':
-            score += 2
-            insights.append("Moderate positioning clarity")
-
-        return min(score, 15), insights
+        return self.score_dimension('differentiation', diff_data)
 
     def score_technical_feasibility(self, tech_data: Dict) -> tuple[int, List[str]]:
         """
         Score technical feasibility (max 15 points)
         Based on: complexity, time to MVP, technology availability
         """
-        score = 0
-        insights = []
-
-        # Build complexity (0-7 points, inverse)
-        complexity = tech_data.get('complexity', 'medium').lower()
-        if complexity == 'low':
-            score += 7
-            insights.append("Low technical complexity - quick to build")
-        elif complexity == 'medium':
-            score += 4
-            insights.append("Medium complexity - reasonable timeline")
-        else:
-            score += 1
-            insights.append("High complexity - long development time")
-
-        # Time to MVP (0-5 points)
-        time_to_mvp = tech_data.get('estimated_sprint_count', 999)
-        if time_to_mvp <= 2:
-            score += 5
-            insights.append(f"Quick MVP possible ({time_to_mvp} sprints)")
-        elif time_to_mvp <= 4:
-            score += 3
-            insights.append(f"Moderate MVP timeline ({time_to_mvp} sprints)")
-        else:
-            score += 1
-            insights.append(f"Long MVP timeline ({time_to_mvp}+ sprints)")
-
-        # Tech availability (0-3 points)
-        tech_available = tech_data.get('required_tech_available', False)
-        if tech_available:
-            score += 3
-            insights.append("Required technology/APIs available")
-        else:
-            insights.append("Missing required technology - needs R&D")
-
-        return min(score, 15), insights
+        return self.score_dimension('technical_feasibility', tech_data)
 
     def score_personal_fit(self, fit_data: Dict) -> tuple[int, List[str]]:
         """
         Score personal fit (max 15 points)
         Based on: domain understanding, passion, sustainability
         """
-        score = 0
-        insights = []
-
-        # Domain understanding (0-7 points)
-        understanding = fit_data.get('domain_understanding', 'low').lower()
-        if understanding == 'high':
-            score += 7
-            insights.append("Strong domain expertise")
-        elif understanding == 'medium':
-            score += 4
-            insights.append("Moderate domain knowledge")
-        else:
-            score += 1
-            insights.append("Limited domain expertise")
-
-        # Passion/interest (0-5 points)
-        passion_level = fit_data.get('passion_level', 'medium').lower()
-        if passion_level == 'high':
-            score += 5
-            insights.append("High passion for this problem space")
-        elif passion_level == 'medium':
-            score += 3
-            insights.append("Moderate interest in problem space")
-        else:
-            score += 1
-            insights.append("Low interest - may affect sustainability")
-
-        # Sustainable motivation (0-3 points)
-        sustainable = fit_data.get('sustainable_motivation', False)
-        if sustainable:
-            score += 3
-            insights.append("Long-term motivation sustainable")
-        else:
-            insights.append("Motivation sustainability unclear")
-
-        return min(score, 15), insights
+        return self.score_dimension('personal_fit', fit_data)
 
     def calculate_comprehensive_score(self, opportunity_data: Dict) -> OpportunityScore:
         """Calculate comprehensive opportunity score"""
@@ -354,15 +1100,7 @@ class OpportunityScorecardAutomation:
                 diff_score + tech_score + fit_score)
 
         # Make decision
-        if total >= self.DECISION_THRESHOLD_BUILD:
-            decision = "BUILD IT"
-            recommendation = f"✅ Strong opportunity (score: {total}/100). Proceed to build phase."
-        elif total >= self.DECISION_THRESHOLD_MAYBE:
-            decision = "MAYBE - INVESTIGATE"
-            recommendation = f"⚠️  Moderate opportunity (score: {total}/100). Needs deeper validation before committing."
-        else:
-            decision = "PASS - PIVOT"
-            recommendation = f"❌ Weak opportunity (score: {total}/100). Consider pivoting or finding new idea."
+        decision, recommendation = self.DECISION(total)
 
         # Compile all insights as risks/considerations
         all_insights = (problem_insights + market_insights + comp_insights +
@@ -411,16 +1149,18 @@ class OpportunityScorecardAutomation:
         return steps
 
     def export_scorecard(self, score: OpportunityScore, output_dir: str = "output"):
-        """Export scorecard to JSON"""
+        """Export scorecard to JSON (an OpportunityScore or a ScorePortfolio row), and index it if enabled"""
         Path(output_dir).mkdir(exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{output_dir}/scorecard_{score.opportunity_name.replace(' ', '_')}_{timestamp}.json"
 
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(asdict(score), f, indent=2)
+            json.dump(score.to_dict() if isinstance(score, PortfolioScore) else asdict(score), f, indent=2)
 
         print(f"✅ Scorecard exported: {filename}")
+        if self.index is not None:
+            self.index.add(score, filename)
         return filename
 
     def generate_report(self, score: OpportunityScore) -> str:
@@ -474,8 +1214,523 @@ class OpportunityScorecardAutomation:
         return '\n'.join([f"- {item}" for item in items])
 
 
+class IncrementalScorecard(OpportunityScorecardAutomation):
+    """
+    OpportunityScorecardAutomation that only recomputes dimensions whose inputs changed
+
+    Each dimension's (score, insights) is cached in memory under the values
+    and types of the fields it reads from its input section (5 and 5.0
+    format differently). Totals, decisions, recommendations and next steps
+    are still derived on every call from the cached dimensions, so a
+    re-score of a portfolio where only market data moved recomputes just
+    the market dimension. The cache lives as long as the scorer.
+    """
+
+    MISSING = object()
+
+    def __init__(self, index: Optional[ScoreIndex] = None):
+        super().__init__(index)
+        self._cache: Dict[tuple, tuple] = {}
+        self._fields = {dimension: tuple(name for field, _, _, _, *gate in inputs
+                                         for name in ((field, gate[0][0]) if gate else (field,)))
+                        for dimension, (_, _, inputs) in self.DIMENSIONS.items()}
+        self.stats = {dimension: {'hits': 0, 'misses': 0} for dimension in self.DIMENSIONS}
+
+    def score_dimension(self, dimension: str, data: Dict) -> tuple[int, List[str]]:
+        values = tuple(data.get(field, self.MISSING) for field in self._fields[dimension])
+        key = (dimension, values, tuple(map(type, values)))
+        try:
+            cached = self._cache.get(key)
+        except TypeError:
+            # Unhashable inputs (lists, dicts) are keyed by their JSON
+            key = (dimension, json.dumps(values, sort_keys=True, default=repr), key[2])
+            cached = self._cache.get(key)
+        if cached is None:
+            self.stats[dimension]['misses'] += 1
+            score, insights = super().score_dimension(dimension, data)
+            cached = self._cache[key] = (score, tuple(insights))
+        else:
+            self.stats[dimension]['hits'] += 1
+        return cached[0], list(cached[1])
+
+
+# One scorer per worker process
+_worker_scorer = None
+
+
+def _score_chunk(items: List[tuple]) -> List[Dict]:
+    """
+    Score (source, text) pairs in a worker process
+
+    `text` is the raw JSON of one opportunity, or None to read `source` as
+    a file. Unreadable or unscorable inputs come back with an 'error'.
+    """
+    global _worker_scorer
+    if _worker_scorer is None:
+        _worker_scorer = OpportunityScorecardAutomation()
+    records = []
+    for source, text in items:
+        try:
+            if text is None:
+                with open(source, encoding='utf-8') as f:
+                    text = f.read()
+            record = asdict(_worker_scorer.calculate_comprehensive_score(json.loads(text)))
+            record['error'] = None
+        except Exception as e:
+            record = {'opportunity_name': None, 'error': f"{type(e).__name__}: {e}"}
+        record['source'] = source
+        records.append(record)
+    return records
+
+
+class ScorecardRunner:
+    """
+    Scores a directory of opportunity JSON files, or a JSONL file, across a process pool.
+
+    The parent process only lists files or reads lines. Workers parse and
+    score chunks of `chunk_size` opportunities. At most `workers * 2`
+    chunks are in flight, and their results are written in input order
+    as each oldest chunk completes. Memory therefore stays flat however
+    large the input is, and throughput grows with the number of workers.
+    Results go to one JSONL or Parquet file. An optional markdown report
+    ranks the `top` best opportunities and includes their full scorecards.
+    """
+
+    PARQUET_SCHEMA = None if pyarrow is None else pyarrow.schema([
+        ('source', pyarrow.string()),
+        ('opportunity_name', pyarrow.string()),
+        ('total_score', pyarrow.int16()),
+        ('max_score', pyarrow.int16()),
+        ('problem_severity', pyarrow.int8()),
+        ('market_size', pyarrow.int8()),
+        ('competition_level', pyarrow.int8()),
+        ('differentiation', pyarrow.int8()),
+        ('technical_feasibility', pyarrow.int8()),
+        ('personal_fit', pyarrow.int8()),
+        ('decision', pyarrow.dictionary(pyarrow.int8(), pyarrow.string())),
+        ('recommendation', pyarrow.string()),
+        ('risks', pyarrow.list_(pyarrow.string())),
+        ('next_steps', pyarrow.list_(pyarrow.string())),
+        ('scored_at', pyarrow.string()),
+        ('error', pyarrow.string()),
+    ])
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 256):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def iter_inputs(source: str):
+        """Yield (source, text) per opportunity: file paths lazily from a directory, lines from JSONL"""
+        path = Path(source)
+        if path.is_dir():
+            for file in sorted(path.glob('*.json')):
+                yield str(file), None
+            return
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    yield f"{path.name}:{number}", line
+
+    def _chunks(self, source: str):
+        chunk = []
+        for item in self.iter_inputs(source):
+            chunk.append(item)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _scored_chunks(self, source: str):
+        """Scored chunks in input order, with a bounded number in flight"""
+        if self.workers == 1:
+            yield from map(_score_chunk, self._chunks(source))
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for chunk in self._chunks(source):
+                pending.append(pool.submit(_score_chunk, chunk))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def run(self, source: str, output: str, markdown: Optional[str] = None, top: int = 50) -> Dict:
+        """Score everything in `source` into `output` (.jsonl or .parquet) and return run statistics"""
+        parquet = output.endswith('.parquet')
+        if parquet and pyarrow is None:
+            raise RuntimeError("Parquet results require: pip install pyarrow")
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+        stats = {'scored': 0, 'failed': 0, 'decisions': {}}
+        best = []  # min-heap of the `top` highest totals
+        started = time.perf_counter()
+        jsonl = None if parquet else open(output, 'w', encoding='utf-8')
+        writer = pyarrow.parquet.ParquetWriter(output, self.PARQUET_SCHEMA) if parquet else None
+        try:
+            for records in self._scored_chunks(source):
+                for record in records:
+                    if record['error']:
+                        stats['failed'] += 1
+                        print(f"⚠️  {record['source']}: {record['error']}")
+                        continue
+                    stats['scored'] += 1
+                    stats['decisions'][record['decision']] = stats['decisions'].get(record['decision'], 0) + 1
+                    if markdown:
+                        # Earlier opportunities win ties
+                        entry = (record['total_score'], -stats['scored'], record)
+                        if len(best) < top:
+                            heapq.heappush(best, entry)
+                        elif entry[:2] > best[0][:2]:
+                            heapq.heapreplace(best, entry)
+                if parquet:
+                    writer.write_table(pyarrow.Table.from_pylist(records, schema=self.PARQUET_SCHEMA))
+                else:
+                    jsonl.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+        finally:
+            if jsonl is not None:
+                jsonl.close()
+            if writer is not None:
+                writer.close()
+
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        print(f"✅ Scored {stats['scored']:,} opportunities ({stats['failed']} failed) in {stats['seconds']}s "
+              f"with {self.workers} workers: {output}")
+        if markdown:
+            ranked = [record for _, _, record in sorted(best, key=lambda entry: entry[:2], reverse=True)]
+            self.write_report(markdown, ranked, stats)
+            print(f"✅ Report written: {markdown}")
+        return stats
+
+    @staticmethod
+    def write_report(path: str, ranked: List[Dict], stats: Dict):
+        """Markdown summary of a run, then the full scorecards of the ranked opportunities"""
+        scorer = OpportunityScorecardAutomation()
+        fields = set(OpportunityScore.__dataclass_fields__)
+        counts = '\n'.join(f"| {decision} | {count:,} |" for decision, count in
+                           sorted(stats['decisions'].items(), key=lambda item: -item[1]))
+        rows = '\n'.join(
+            f"| {rank} | {record['opportunity_name']} | {record['total_score']} | {record['decision']} | "
+            f"{record['problem_severity']} | {record['market_size']} | {record['competition_level']} | "
+            f"{record['differentiation']} | {record['technical_feasibility']} | {record['personal_fit']} |"
+            for rank, record in enumerate(ranked, 1))
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"""# Hermetic Opportunity Scorecards
+
+Scored: {stats['scored']:,} | Failed: {stats['failed']:,} | Generated: {datetime.now().isoformat()}
+
+| Decision | Opportunities |
+|----------|---------------|
+{counts}
+
+## Top {len(ranked)}
+
+| # | Opportunity | Total | Decision | Problem | Market | Competition | Differentiation | Technical | Fit |
+|---|-------------|-------|----------|---------|--------|-------------|-----------------|-----------|-----|
+{rows}
+""")
+            for record in ranked:
+                score = OpportunityScore(**{key: value for key, value in record.items() if key in fields})
+                f.write(f"\n---\n{scorer.generate_report(score)}")
+
+
+def synthetic_opportunities(count: int, seed: int = 42) -> List[Dict]:
+    """Random but plausible opportunity dicts covering every scoring rung"""
+    rng = random.Random(seed)
+    levels = ['low', 'medium', 'high']
+    return [{
+        'name': f"Opportunity {i}",
+        'problem': {'severity_score': rng.randint(1, 10),
+                    'frequency': rng.choice(['daily', 'constant', 'weekly', 'frequent', 'monthly', 'rarely']),
+                    'people_affected': rng.choice([0, 500, 5000, 50000, 250000])},
+        'market': {'tam_millions': round(rng.uniform(0, 200), 1), 'monthly_searches': rng.randint(0, 80000),
+                   'growth_rate_percent': rng.randint(-30, 90)},
+        'competition': {'num_competitors': rng.randint(0, 20), 'avg_quality_score': rng.randint(1, 10),
+                        'saturation_level': rng.choice(levels)},
+        'differentiation': {'has_unique_angle': rng.random() < 0.7,
+                            'angle_strength': rng.choice(['strong', 'moderate', 'weak']),
+                            'tech_advantage': rng.random() < 0.4,
+                            'positioning_clarity': rng.choice(['clear', 'moderate', 'unclear'])},
+        'technical': {'complexity': rng.choice(levels), 'estimated_sprint_count': rng.randint(1, 8),
+                      'required_tech_available': rng.random() < 0.8},
+        'personal_fit': {'domain_understanding': rng.choice(levels), 'passion_level': rng.choice(levels),
+                         'sustainable_motivation': rng.random() < 0.6},
+    } for i in range(count)]
+
+
+def benchmark_batch(count: int = 50_000) -> Dict:
+    """Compare per-opportunity calculate_comprehensive_score with score_batch over columnar input"""
+    if pd is None:
+        raise RuntimeError("Bulk scoring requires: pip install numpy pandas")
+    scorer = OpportunityScorecardAutomation()
+    opportunities = synthetic_opportunities(count)
+    frame = pd.json_normalize(opportunities)
+
+    started = time.perf_counter()
+    previous = [scorer.calculate_comprehensive_score(opportunity) for opportunity in opportunities]
+    previous_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = scorer.score_batch(frame)
+    batch_seconds = time.perf_counter() - started
+
+    scores = batch.to_frame()
+    for dimension in scorer.DIMENSIONS:
+        assert scores[dimension].tolist() == [getattr(score, dimension) for score in previous], dimension
+    assert scores['total_score'].tolist() == [score.total_score for score in previous], "totals differ"
+    assert scores['decision'].tolist() == [score.decision for score in previous], "decisions differ"
+    print(f"{count:,} opportunities: one at a time {previous_seconds:.2f}s | batch {batch_seconds:.3f}s "
+          f"({previous_seconds / batch_seconds:,.0f}x)")
+    return {'previous_seconds': round(previous_seconds, 4), 'batch_seconds': round(batch_seconds, 4)}
+
+
+def benchmark_incremental(count: int = 20_000) -> Dict:
+    """Re-score a portfolio where only market data changed, with and without IncrementalScorecard"""
+    strip = lambda score: {k: v for k, v in asdict(score).items() if k != 'scored_at'}
+    scorer = OpportunityScorecardAutomation()
+    incremental = IncrementalScorecard()
+    opportunities = synthetic_opportunities(count)
+    rng = random.Random(7)
+    results = {}
+    for run in ('first', 'nightly'):
+        if run == 'nightly':
+            for opportunity in opportunities:
+                opportunity['market']['monthly_searches'] = rng.randint(0, 80_000)
+        incremental.stats = {dimension: {'hits': 0, 'misses': 0} for dimension in incremental.DIMENSIONS}
+
+        started = time.perf_counter()
+        full = [scorer.calculate_comprehensive_score(opportunity) for opportunity in opportunities]
+        full_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scores = [incremental.calculate_comprehensive_score(opportunity) for opportunity in opportunities]
+        incremental_seconds = time.perf_counter() - started
+
+        assert [strip(score) for score in scores] == [strip(score) for score in full], "scores differ"
+        hits = sum(stat['hits'] for stat in incremental.stats.values()) / (len(incremental.DIMENSIONS) * count)
+        recomputed = {dimension: stat['misses'] for dimension, stat in incremental.stats.items() if stat['misses']}
+        print(f"{run:>7} run over {count:,}: full {full_seconds:6.2f}s | incremental {incremental_seconds:6.2f}s | "
+              f"cache hits {hits:4.0%} | recomputed {recomputed}")
+        results[run] = {'full_seconds': round(full_seconds, 4), 'incremental_seconds': round(incremental_seconds, 4),
+                        'hit_rate': round(hits, 4)}
+    return results
+
+
+def benchmark_runner(count: int = 20_000) -> Dict:
+    """Time ScorecardRunner over a synthetic JSONL file at 1, 2, 4... workers up to the core count"""
+    import tempfile
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'opportunities.jsonl')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(opportunity) + '\n' for opportunity in synthetic_opportunities(count))
+        workers = 1
+        while True:
+            stats = ScorecardRunner(workers).run(source, os.path.join(tmp, f'scores_{workers}.jsonl'))
+            results[workers] = stats['seconds']
+            if workers >= (os.cpu_count() or 1):
+                break
+            workers = min(workers * 2, os.cpu_count())
+
+    for workers, seconds in results.items():
+        print(f"{workers:>3} workers: {seconds:7.2f}s ({count / seconds:,.0f} opportunities/s, "
+              f"{results[1] / seconds:.1f}x)")
+    return results
+
+
+def benchmark_portfolio(count: int = 100_000) -> Dict:
+    """Compare the memory held by a list of OpportunityScore with a ScorePortfolio of the same scores"""
+    import tracemalloc
+
+    scorer = OpportunityScorecardAutomation()
+    opportunities = synthetic_opportunities(count)
+
+    tracemalloc.start()
+    scores = [scorer.calculate_comprehensive_score(opportunity) for opportunity in opportunities]
+    objects_bytes = tracemalloc.get_traced_memory()[0]
+    portfolio = ScorePortfolio()
+    portfolio.extend(scores)
+    portfolio_bytes = tracemalloc.get_traced_memory()[0] - objects_bytes
+    tracemalloc.stop()
+
+    for row in range(0, count, max(1, count // 1000)):
+        assert portfolio.to_dict(row) == asdict(scores[row]), f"row {row} differs"
+    print(f"{count:,} scores: OpportunityScore objects {objects_bytes / 2**20:7.1f} MB | "
+          f"ScorePortfolio {portfolio_bytes / 2**20:5.1f} MB ({objects_bytes / portfolio_bytes:.0f}x smaller, "
+          f"{len(portfolio.strings):,} distinct strings)")
+    return {'objects_bytes': objects_bytes, 'portfolio_bytes': portfolio_bytes}
+
+
+def benchmark_index(count: int = 100_000) -> Dict:
+    """Threshold and top-k queries through a ScoreIndex vs filtering every scorecard in Python"""
+    import tempfile
+
+    scorer = OpportunityScorecardAutomation()
+    opportunities = synthetic_opportunities(count)
+    week_ago = datetime.now() - timedelta(days=7)
+    rng = random.Random(7)
+    scorings = []
+    for scored_at in (week_ago - timedelta(days=1), datetime.now()):
+        frame = scorer.score_batch(opportunities).to_frame()
+        frame['decision'] = frame['decision'].astype(str)
+        frame['scored_at'] = scored_at.isoformat()
+        scorings.append(frame.to_dict('records'))
+        for opportunity in opportunities:
+            opportunity['market']['monthly_searches'] = rng.randint(0, 80_000)
+    before = {record['opportunity_name']: record for record in scorings[0]}
+    latest = scorings[1]
+    by_total = lambda record: -record['total_score']
+
+    queries = {
+        'top 50 BUILD IT, technical_feasibility >= 11': (
+            dict(decision='BUILD IT', k=50, technical_feasibility=11),
+            lambda: sorted((r for r in latest if 'BUILD IT' in r['decision'] and r['technical_feasibility'] >= 11),
+                           key=by_total)[:50]),
+        'MAYBE, market_size improved this week': (
+            dict(decision='MAYBE', improved='market_size', since=week_ago),
+            lambda: sorted((r for r in latest if 'MAYBE' in r['decision']
+                            and r['market_size'] > before[r['opportunity_name']]['market_size']), key=by_total)),
+        'top 50 overall': (dict(k=50), lambda: sorted(latest, key=by_total)[:50]),
+        'competition 12-15 and personal_fit >= 13': (
+            dict(competition_level=(12, 15), personal_fit=13),
+            lambda: sorted((r for r in latest if 12 <= r['competition_level'] <= 15 and r['personal_fit'] >= 13),
+                           key=by_total)),
+    }
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        index = ScoreIndex(str(Path(tmp) / 'score_index.db'))
+        start = time.perf_counter()
+        index.add_many(scorings[0] + scorings[1])
+        index.query(k=1)
+        print(f"Indexed {2 * count:,} scores of {count:,} opportunities in {time.perf_counter() - start:.2f}s")
+        for name, (query, scan) in queries.items():
+            repeat = 5
+            start = time.perf_counter()
+            for _ in range(repeat):
+                found = index.query(**query)
+            index_seconds = (time.perf_counter() - start) / repeat
+            start = time.perf_counter()
+            for _ in range(repeat):
+                expected = scan()
+            scan_seconds = (time.perf_counter() - start) / repeat
+            assert [r['opportunity_name'] for r in found] == [r['opportunity_name'] for r in expected], name
+            print(f"{name:<45} {len(found):>6,} results | index {index_seconds * 1000:8.2f} ms | "
+                  f"scan {scan_seconds * 1000:8.2f} ms ({scan_seconds / index_seconds:,.1f}x)")
+            results[name] = {'index_seconds': index_seconds, 'scan_seconds': scan_seconds}
+
+        # Scores added one at a time are buffered and merged by the next query
+        updates = [dict(record, scored_at=datetime.now().isoformat(), market_size=rng.randint(0, 20))
+                   for record in rng.sample(latest, min(500, count))]
+        start = time.perf_counter()
+        for record in updates:
+            index.add(record)
+        add_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        index.query(k=50)
+        merge_seconds = time.perf_counter() - start
+        print(f"{len(updates):,} add() calls {add_seconds * 1000:8.2f} ms | next query {merge_seconds * 1000:8.2f} ms")
+        results['add'] = {'add_seconds': add_seconds, 'merge_seconds': merge_seconds}
+        query = dict(decision='BUILD IT', k=50, technical_feasibility=11)
+        expected = index.query(**query)
+        index.close()
+
+        # A new process (e.g. one --query call) loads the snapshot saved by close()
+        path = str(Path(tmp) / 'score_index.db')
+        for name in ('snapshot', 'table scan'):
+            if name == 'table scan':
+                with sqlite3.connect(path) as conn:
+                    conn.execute("DELETE FROM index_snapshot")
+            start = time.perf_counter()
+            index = ScoreIndex(path)
+            found = index.query(**query)
+            seconds = time.perf_counter() - start
+            index.close()
+            assert found == expected, name
+            print(f"First query of a new process from the {name:<10} {seconds * 1000:8.2f} ms")
+            results[name] = seconds
+    return results
+
+
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Score MicroSaaS opportunities with the Hermetic framework")
+    parser.add_argument('--input', metavar='PATH',
+                        help="score every opportunity in PATH (a directory of .json files or a .jsonl file)")
+    parser.add_argument('--output', default='output/scorecards.jsonl', metavar='PATH',
+                        help="results file for --input, .jsonl or .parquet (default: output/scorecards.jsonl)")
+    parser.add_argument('--markdown', metavar='PATH', help="also write a combined markdown report to PATH")
+    parser.add_argument('--top', type=int, default=50, help="opportunities ranked in the markdown report (default: 50)")
+    parser.add_argument('--workers', type=int, help="scoring processes (default: one per core)")
+    parser.add_argument('--chunk-size', type=int, default=256, help="opportunities per work unit (default: 256)")
+    parser.add_argument('--index', metavar='PATH',
+                        help="index exported scorecards in the SQLite file PATH (default for queries: output/score_index.db)")
+    parser.add_argument('--index-exports', metavar='PATH',
+                        help="add earlier results (a directory of scorecard JSON files or a results JSONL) to the index")
+    parser.add_argument('--query', action='store_true', help="list the --top indexed opportunities matching the filters")
+    parser.add_argument('--decision', help="only decisions containing this text, e.g. 'BUILD IT' or MAYBE")
+    parser.add_argument('--where', action='append', default=[], metavar='COLUMN>=N',
+                        help="score condition with >=, <= or =, e.g. technical_feasibility>=11 (repeatable)")
+    parser.add_argument('--improved', metavar='COLUMN', help="only opportunities whose COLUMN score rose since --since")
+    parser.add_argument('--since', type=float, default=7, metavar='DAYS', help="--improved baseline age (default: 7)")
+    parser.add_argument('--benchmark-index', type=int, metavar='N', nargs='?', const=100_000,
+                        help="benchmark index queries over N synthetic opportunities against a full scan and exit")
+    parser.add_argument('--benchmark-runner', type=int, metavar='N', nargs='?', const=20_000,
+                        help="benchmark --input over N synthetic opportunities at 1..cores workers and exit")
+    parser.add_argument('--benchmark-portfolio', type=int, metavar='N', nargs='?', const=100_000,
+                        help="compare the memory of N OpportunityScores with a ScorePortfolio and exit")
+    parser.add_argument('--benchmark-batch', type=int, metavar='N', nargs='?', const=50_000,
+                        help="benchmark bulk scoring of N synthetic opportunities and exit")
+    parser.add_argument('--benchmark-incremental', type=int, metavar='N', nargs='?', const=20_000,
+                        help="benchmark a re-score of N opportunities where only market data changed, and exit")
+    args = parser.parse_args()
+
+    if args.benchmark_batch:
+        benchmark_batch(args.benchmark_batch)
+        return
+    if args.benchmark_incremental:
+        benchmark_incremental(args.benchmark_incremental)
+        return
+    if args.benchmark_portfolio:
+        benchmark_portfolio(args.benchmark_portfolio)
+        return
+    if args.benchmark_runner:
+        benchmark_runner(args.benchmark_runner)
+        return
+    if args.benchmark_index:
+        benchmark_index(args.benchmark_index)
+        return
+    if args.index_exports or args.query:
+        index = ScoreIndex(args.index or 'output/score_index.db')
+        if args.index_exports:
+            print(f"✅ Indexed {index.add_exports(args.index_exports):,} scorecards ({len(index):,} opportunities)")
+        if args.query:
+            ranges = {}
+            for condition in args.where:
+                match = re.fullmatch(r'\s*(\w+)\s*(>=|<=|=)\s*(-?\d+)\s*', condition)
+                if not match:
+                    parser.error(f"--where expects COLUMN>=N, COLUMN<=N or COLUMN=N, not {condition!r}")
+                column, op, value = match.group(1), match.group(2), int(match.group(3))
+                low, high = ranges.get(column, (None, None))
+                ranges[column] = (value if op != '<=' else low, value if op != '>=' else high)
+            since = datetime.now() - timedelta(days=args.since)
+            try:
+                results = index.query(args.decision, args.top, improved=args.improved, since=since, **ranges)
+            except ValueError as e:
+                parser.error(str(e))
+            print(f"🔎 {len(results)} matching opportunities")
+            for rank, result in enumerate(results, 1):
+                print(f"{rank:>4}. {result['total_score']:>3}/100  {result['decision']:<20}  {result['opportunity_name']}")
+        index.close()
+        return
+    if args.input:
+        ScorecardRunner(args.workers, args.chunk_size).run(args.input, args.output, args.markdown, args.top)
+        return
 
     # Example opportunity data
     example_opportunity = {
@@ -516,7 +1771,7 @@ def main():
     print("🎯 Hermetic Opportunity Scorecard")
     print("=" * 60)
 
-    scorer = OpportunityScorecardAutomation()
+    scorer = OpportunityScorecardAutomation(ScoreIndex(args.index) if args.index else None)
 
     # Calculate score
     score = scorer.calculate_comprehensive_score(example_opportunity)
@@ -527,6 +1782,8 @@ def main():
 
     # Export
     scorer.export_scorecard(score)
+    if scorer.index is not None:
+        scorer.index.close()
 
     print("\n✨ Scoring complete!")
 